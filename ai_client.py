@@ -4,10 +4,16 @@ Supports both real API calls and mock mode for testing
 """
 
 import os
-import json
+import re
+import asyncio
+import time
+import random
+import hashlib
 import logging
-from typing import Optional
-from anthropic import Anthropic, AsyncAnthropic
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
+from anthropic import Anthropic, AsyncAnthropic, RateLimitError
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -15,6 +21,343 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Exact-prompt response cache (shared by all client instances). With
+# REDIS_URL set, responses are also shared by every API and worker process
+# for CACHE_TTL_HOURS.
+ENABLE_CACHING = os.getenv("ENABLE_CACHING", "true").lower() == "true"
+RESPONSE_CACHE_SIZE = 1024
+CACHE_MAX_TEMPERATURE = 0.3  # Above this, callers expect varied output
+CACHE_REDIS_URL = os.getenv("REDIS_URL")
+CACHE_TTL_SECONDS = int(float(os.getenv("CACHE_TTL_HOURS", "24")) * 3600)
+CACHE_KEY_PREFIX = "ai:"
+
+# Tokens (prompt + completion) per minute this process may spend; 0 disables
+# throttling. Rate-limited calls are retried with backoff before giving up.
+ANTHROPIC_TPM = int(os.getenv("ANTHROPIC_TPM", "30000"))
+RATE_LIMIT_RETRIES = 2
+RATE_LIMIT_MAX_DELAY = 30  # seconds
+
+_response_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+
+
+def _digest(text: str) -> bytes:
+    """128-bit BLAKE2b digest of text"""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+def _cache_key(
+    model: str,
+    system_message: Optional[str],
+    prompt: str,
+    temperature: float,
+    top_p: float,
+    max_tokens: int
+) -> Tuple:
+    """Build response cache key from all generation parameters"""
+    system_hash = _digest(system_message) if system_message else b""
+    return (
+        _digest(prompt),
+        model,
+        int(temperature * 1000),
+        int(top_p * 1000),
+        max_tokens,
+        system_hash
+    )
+
+
+def _cache_get(key: Tuple) -> Optional[str]:
+    """Return cached response and mark it most recently used"""
+    response = _response_cache.get(key)
+    if response is not None:
+        _response_cache.move_to_end(key)
+    return response
+
+
+def _cache_put(key: Tuple, response: str) -> None:
+    """Store response, evicting the least recently used entry when full"""
+    _response_cache[key] = response
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+def _redis_key(key: Tuple) -> str:
+    """Redis key for a response cache key (the same in every process)"""
+    return CACHE_KEY_PREFIX + hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+class AnthropicAPIError(Exception):
+    """Anthropic API request failed"""
+    pass
+
+
+class AnthropicRateLimitError(AnthropicAPIError):
+    """Anthropic API rejected the request with 429"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    Tokens-per-minute budget shared by concurrent API calls
+    
+    acquire() waits until the estimated tokens for a call are available,
+    refilling continuously at tokens_per_minute / 60 per second.
+    
+    Holds no asyncio primitives, so one bucket works across event loops.
+    """
+    
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = float(tokens_per_minute)
+        self.rate = self.capacity / 60
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+    
+    async def acquire(self, tokens: int) -> None:
+        if self.capacity <= 0:
+            return
+        # A call larger than the whole budget waits for a full bucket
+        tokens = min(tokens, self.capacity)
+        
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        
+        # Reserve the tokens up front, letting the balance go negative, and
+        # sleep off the deficit. Later callers wait behind earlier
+        # reservations, so calls are served in order without holding a lock.
+        self.tokens -= tokens
+        if self.tokens < 0:
+            try:
+                await asyncio.sleep(-self.tokens / self.rate)
+            except asyncio.CancelledError:
+                self.tokens += tokens
+                raise
+
+
+_token_bucket = TokenBucket(ANTHROPIC_TPM)
+
+
+def _retry_after(error: RateLimitError) -> Optional[float]:
+    """Seconds from the response's retry-after header, if present"""
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class JsonObjectScanner:
+    """
+    Incremental scanner for the first top-level JSON object in a text stream
+    
+    Tracks bracket nesting, string and escape state one character at a time,
+    so a streamed response can be cut off as soon as its JSON object closes.
+    Text before the first "{" is skipped, and so is any bracketed span that
+    doesn't parse as JSON (e.g. a "{placeholder}" in a prose preamble).
+    """
+    
+    _OPENERS = {"}": "{", "]": "["}
+    
+    def __init__(self):
+        self.start = -1  # Index of the opening brace
+        self.end = -1  # Index just past the closing brace
+        self._pos = 0
+        self._chunks: List[str] = []
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+    
+    @property
+    def complete(self) -> bool:
+        return self.end != -1
+    
+    def feed(self, chunk: str) -> bool:
+        """Consume chunk; return True once a complete JSON object has been found"""
+        if self.complete:
+            return True
+        
+        self._chunks.append(chunk)
+        for offset, char in enumerate(chunk):
+            if self.start == -1:
+                if char == "{":
+                    self.start = self._pos + offset
+                    self._stack.append(char)
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{" or char == "[":
+                self._stack.append(char)
+            elif char == "}" or char == "]":
+                if self._stack.pop() != self._OPENERS[char]:
+                    self._restart()
+                elif not self._stack:
+                    end = self._pos + offset + 1
+                    if self._parses(end):
+                        self.end = end
+                        return True
+                    self._restart()
+        
+        self._pos += len(chunk)
+        return False
+    
+    def _parses(self, end: int) -> bool:
+        """True if the balanced span ending at end is valid JSON"""
+        try:
+            orjson.loads("".join(self._chunks)[self.start:end])
+            return True
+        except orjson.JSONDecodeError:
+            return False
+    
+    def _restart(self) -> None:
+        """Drop the current candidate and look for the next opening brace"""
+        self.start = -1
+        self._stack.clear()
+        self._in_string = False
+        self._escape = False
+
+
+def _find_json_object(text: str) -> Optional[str]:
+    """Return the first balanced top-level JSON object in text, if any"""
+    scanner = JsonObjectScanner()
+    scanner.feed(text)
+    return text[scanner.start:scanner.end] if scanner.complete else None
+
+
+# Shared Anthropic clients, one per API key, so connection pools and TLS
+# sessions are reused across jobs
+_shared_clients: Dict[str, AsyncAnthropic] = {}
+
+
+def get_shared_client(api_key: str) -> AsyncAnthropic:
+    """Return the process-wide AsyncAnthropic client for api_key"""
+    client = _shared_clients.get(api_key)
+    if client is None:
+        client = _shared_clients[api_key] = AsyncAnthropic(api_key=api_key)
+    return client
+
+
+async def close_shared_client(api_key: str) -> None:
+    """Close the shared AsyncAnthropic client for api_key, if one is open"""
+    client = _shared_clients.pop(api_key, None)
+    if client is not None:
+        await client.close()
+
+
+_BIZ_NAME_RE = re.compile(r"Business name:\s*(.+)")
+
+# Mock prompt markers -> response builder, in priority order
+_MOCK_PROMPT_TYPES = {
+    "site architecture": "_generate_planning_response",
+    "generate production-ready wordpress content": "_generate_content_response",
+    "blog posts": "_generate_posts_response",
+}
+
+# All markers in one case-insensitive pattern; group N is the Nth marker
+_MOCK_PROMPT_RE = re.compile(
+    "|".join(f"({re.escape(marker)})" for marker in _MOCK_PROMPT_TYPES),
+    re.IGNORECASE
+)
+_MOCK_BUILDERS = tuple(_MOCK_PROMPT_TYPES.values())
+
+
+# Default system message for WordPress site generation
+DEFAULT_SYSTEM_MESSAGE = """You are an autonomous WordPress site generation agent.
+You must output ONLY valid JSON following the exact schema specified in the prompt.
+Be deterministic and precise. Use temperature=0.10 for consistency.
+Never include explanatory text outside the JSON structure."""
+
+_EXTRACTION_FAILED_JSON = orjson.dumps({
+    "status": "failed",
+    "action": "json_extraction_failed",
+    "result_summary": "Could not extract valid JSON from AI response",
+    "result": {},
+    "assumptions": ["AI response was not valid JSON"],
+    "confidence": 0.0,
+    "next_steps": ["retry_with_clearer_prompt"]
+}).decode()
+
+# Mock responses, serialized once at import
+_BUSINESS_NAME_PLACEHOLDER = "{BUSINESS_NAME}"
+
+_PLANNING_TEMPLATE_JSON = orjson.dumps({
+    "status": "ok",
+    "action": "site_architecture_generated",
+    "result_summary": "Generated architecture for {BUSINESS_NAME}",
+    "result": {
+        "site_structure": {
+            "pages": [
+                {"title": "Home", "slug": "home", "purpose": "Welcome visitors", "content_themes": ["hero", "services"], "priority": "high", "template": "front-page"},
+                {"title": "About Us", "slug": "about", "purpose": "Tell story", "content_themes": ["history", "team"], "priority": "high", "template": "default"},
+                {"title": "Services", "slug": "services", "purpose": "Detail services", "content_themes": ["service_list"], "priority": "high", "template": "default"},
+                {"title": "Menu", "slug": "menu", "purpose": "Display menu", "content_themes": ["menu_items"], "priority": "high", "template": "default"},
+                {"title": "Gallery", "slug": "gallery", "purpose": "Showcase photos", "content_themes": ["photos"], "priority": "medium", "template": "default"},
+                {"title": "Contact", "slug": "contact", "purpose": "Contact info", "content_themes": ["form", "map"], "priority": "high", "template": "default"},
+                {"title": "Blog", "slug": "blog", "purpose": "News updates", "content_themes": ["posts"], "priority": "medium", "template": "default"}
+            ],
+            "menus": [{"location": "primary", "name": "Main Menu", "items": ["Home", "About", "Services", "Contact"]}]
+        },
+        "features": [{"name": "Contact Form", "priority": "high", "implementation": "plugin"}],
+        "plugins": [
+            {"name": "Contact Form 7", "slug": "contact-form-7", "purpose": "Contact forms", "required": True},
+            {"name": "Yoast SEO", "slug": "wordpress-seo", "purpose": "SEO", "required": True}
+        ],
+        "content_strategy": {
+            "post_types": ["posts"],
+            "initial_categories": ["News", "Updates"],
+            "suggested_posts": [
+                {"title": "Welcome", "theme": "introduction"},
+                {"title": "Our Story", "theme": "history"},
+                {"title": "Quality Matters", "theme": "values"}
+            ]
+        },
+        "seo_foundation": {
+            "primary_keywords": ["restaurant", "pizza", "italian"],
+            "site_tagline": "Authentic Italian Cuisine",
+            "meta_description_template": "{BUSINESS_NAME} - Your trusted local business"
+        }
+    },
+    "assumptions": [],
+    "confidence": 0.87,
+    "next_steps": ["generate_content"]
+}).decode()
+
+_CONTENT_RESPONSE_JSON = orjson.dumps({
+    "pages": [
+        {"title": "Home", "slug": "home", "content_html": "<h1>Welcome</h1><p>Experience authentic cuisine...</p>", "seo": {"title": "Home", "meta_description": "Welcome to our restaurant", "slug": "home", "focus_keyword": "restaurant"}},
+        {"title": "About Us", "slug": "about", "content_html": "<h1>Our Story</h1><p>Since 1985...</p>", "seo": {"title": "About", "meta_description": "Our story", "slug": "about", "focus_keyword": "about"}},
+        {"title": "Menu", "slug": "menu", "content_html": "<h1>Menu</h1><p>Delicious dishes...</p>", "seo": {"title": "Menu", "meta_description": "Our menu", "slug": "menu", "focus_keyword": "menu"}},
+        {"title": "Contact", "slug": "contact", "content_html": "<h1>Contact</h1><p>Get in touch...</p>", "seo": {"title": "Contact", "meta_description": "Contact us", "slug": "contact", "focus_keyword": "contact"}}
+    ]
+}).decode()
+
+_GENERIC_RESPONSE_JSON = orjson.dumps({
+    "status": "ok",
+    "action": "generic_action",
+    "result_summary": "Generic mock result",
+    "result": {},
+    "assumptions": [],
+    "confidence": 0.85,
+    "next_steps": []
+}).decode()
+
+_POSTS_RESPONSE_JSON = orjson.dumps({
+    "posts": [
+        {"title": "Welcome", "slug": "welcome", "content_html": "<p>Welcome post...</p>", "excerpt": "Welcome", "categories": ["News"], "tags": ["welcome"]},
+        {"title": "Our Story", "slug": "our-story", "content_html": "<p>Our journey...</p>", "excerpt": "Our story", "categories": ["News"], "tags": ["history"]},
+        {"title": "Quality", "slug": "quality", "content_html": "<p>Quality matters...</p>", "excerpt": "Quality", "categories": ["Updates"], "tags": ["quality"]}
+    ]
+}).decode()
+
 
 class ProductionAIClient:
     """Production AI client with real Anthropic API integration"""
@@ -36,6 +379,7 @@ class ProductionAIClient:
         self.use_mock = use_mock
         self.model = model
         self.logger = logging.getLogger("ProductionAIClient")
+        self._redis = None  # Shared response cache, connected on first use
         
         if not use_mock:
             # Real API mode
@@ -45,8 +389,8 @@ class ProductionAIClient:
                     "Anthropic API key required. Set ANTHROPIC_API_KEY env variable "
                     "or pass api_key parameter, or set use_mock=True for testing."
                 )
-            self.client = AsyncAnthropic(api_key=self.api_key)
-            self.logger.info(f"Initialized with real Anthropic API (model: {model})")
+            self.client = get_shared_client(self.api_key)
+            self.logger.info("Initialized with real Anthropic API (model: %s)", model)
         else:
             # Mock mode
             self.client = None
@@ -58,7 +402,8 @@ class ProductionAIClient:
         temperature: float = 0.1, 
         top_p: float = 0.8,
         max_tokens: int = 600,
-        system_message: Optional[str] = None
+        system_message: Optional[str] = None,
+        no_cache: bool = False
     ) -> str:
         """
         Generate AI response
@@ -69,16 +414,92 @@ class ProductionAIClient:
             top_p: Nucleus sampling parameter
             max_tokens: Maximum tokens to generate
             system_message: Optional system message
+            no_cache: If True, bypass the response cache
             
         Returns:
             JSON string response
         """
         if self.use_mock:
             return await self._generate_mock(prompt, max_tokens)
-        else:
-            return await self._generate_real(
-                prompt, temperature, top_p, max_tokens, system_message
+        
+        cache_key = None
+        if ENABLE_CACHING and not no_cache and temperature <= CACHE_MAX_TEMPERATURE:
+            cache_key = _cache_key(
+                self.model, system_message, prompt, temperature, top_p, max_tokens
             )
+            cached = await self._cache_lookup(cache_key)
+            if cached is not None:
+                self.logger.info("Response cache hit")
+                return cached
+        
+        return await self._generate_real(
+            prompt, temperature, top_p, max_tokens, system_message, cache_key
+        )
+    
+    async def aclose(self):
+        """Close the underlying Anthropic HTTP client and Redis connection"""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+        if not self.use_mock:
+            await close_shared_client(self.api_key)
+    
+    def _get_redis(self):
+        """Redis client for the shared response cache, or None without REDIS_URL"""
+        if self._redis is None and CACHE_REDIS_URL:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(CACHE_REDIS_URL)
+        return self._redis
+    
+    async def _cache_lookup(self, key: Tuple) -> Optional[str]:
+        """Return a cached response from the local LRU, then from Redis"""
+        response = _cache_get(key)
+        if response is not None:
+            return response
+        
+        r = self._get_redis()
+        if r is None:
+            return None
+        try:
+            cached = await r.get(_redis_key(key))
+        except Exception as e:
+            self.logger.warning("Response cache read failed: %s", e)
+            return None
+        if cached is None:
+            return None
+        response = cached.decode()
+        _cache_put(key, response)
+        return response
+    
+    async def _cache_store(self, key: Tuple, response: str) -> None:
+        """Store a response locally and, with REDIS_URL set, in Redis"""
+        _cache_put(key, response)
+        r = self._get_redis()
+        if r is None:
+            return
+        try:
+            await r.setex(_redis_key(key), CACHE_TTL_SECONDS, response)
+        except Exception as e:
+            self.logger.warning("Response cache write failed: %s", e)
+    
+    async def generate_many(
+        self,
+        prompts: List[str],
+        temperature: float = 0.1,
+        top_p: float = 0.8,
+        max_tokens: int = 600,
+        system_message: Optional[str] = None
+    ) -> List[str]:
+        """
+        Generate responses for independent prompts concurrently
+        
+        Returns:
+            JSON string responses, in the same order as prompts
+        """
+        return list(await asyncio.gather(*(
+            self.generate(prompt, temperature, top_p, max_tokens, system_message)
+            for prompt in prompts
+        )))
     
     async def _generate_real(
         self,
@@ -86,20 +507,80 @@ class ProductionAIClient:
         temperature: float,
         top_p: float,
         max_tokens: int,
-        system_message: Optional[str]
+        system_message: Optional[str],
+        cache_key: Optional[Tuple] = None
     ) -> str:
         """Generate response using real Anthropic API"""
-        self.logger.info(f"Calling Anthropic API (max_tokens={max_tokens})")
+        self.logger.info("Calling Anthropic API (max_tokens=%s)", max_tokens)
         
-        # Default system message for WordPress site generation
-        if not system_message:
-            system_message = """You are an autonomous WordPress site generation agent.
-You must output ONLY valid JSON following the exact schema specified in the prompt.
-Be deterministic and precise. Use temperature=0.10 for consistency.
-Never include explanatory text outside the JSON structure."""
+        system_message = system_message or DEFAULT_SYSTEM_MESSAGE
+        # Rough prompt size (~4 chars per token) plus the completion budget
+        estimated_tokens = len(prompt) // 4 + max_tokens
+        
+        try:
+            for attempt in range(RATE_LIMIT_RETRIES + 1):
+                await _token_bucket.acquire(estimated_tokens)
+                try:
+                    response_text, usage = await self._stream_json(
+                        prompt, temperature, top_p, max_tokens, system_message
+                    )
+                    break
+                except AnthropicRateLimitError as e:
+                    if attempt == RATE_LIMIT_RETRIES:
+                        raise
+                    # Honour retry-after when given; jitter spreads out concurrent retries
+                    delay = e.retry_after if e.retry_after is not None else 2 ** attempt
+                    delay = min(delay + random.random(), RATE_LIMIT_MAX_DELAY)
+                    self.logger.warning("Rate limited, retrying in %.1fs", delay)
+                    await asyncio.sleep(delay)
+        except AnthropicAPIError as e:
+            self.logger.error("Anthropic API call failed: %s", e)
+            # Fallback to mock in case of API error
+            self.logger.warning("Falling back to mock response due to API error")
+            return await self._generate_mock(prompt, max_tokens)
+        
+        # Log token usage
+        self.logger.info(
+            "API call successful. Input tokens: %s, Output tokens: %s",
+            usage.input_tokens, usage.output_tokens
+        )
+        
+        # Validate JSON
+        try:
+            orjson.loads(response_text)  # Validate it's valid JSON
+        except orjson.JSONDecodeError as e:
+            self.logger.error("API returned invalid JSON: %s", e)
+            # Try to extract JSON from response
+            return self._extract_json(response_text, max_chars=max_tokens * 10)
         
+        # Only cache responses that came back from the API as valid JSON
+        if cache_key is not None:
+            await self._cache_store(cache_key, response_text)
+        return response_text
+    
+    async def _stream_json(
+        self,
+        prompt: str,
+        temperature: float,
+        top_p: float,
+        max_tokens: int,
+        system_message: str
+    ) -> Tuple[str, Any]:
+        """
+        Stream a completion, stopping as soon as a valid JSON object closes
+        instead of waiting for the full body
+        
+        Returns:
+            (response text, token usage)
+        
+        Raises:
+            AnthropicRateLimitError: If the API rate limit was hit
+            AnthropicAPIError: If the API call fails
+        """
+        scanner = JsonObjectScanner()
+        chunks = []
         try:
-            message = await self.client.messages.create(
+            async with self.client.messages.stream(
                 model=self.model,
                 max_tokens=max_tokens,
                 temperature=temperature,
@@ -108,156 +589,89 @@ Never include explanatory text outside the JSON structure."""
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
-            )
-            
-            # Extract text content
-            response_text = message.content[0].text
-            
-            # Log token usage
-            self.logger.info(
-                f"API call successful. Input tokens: {message.usage.input_tokens}, "
-                f"Output tokens: {message.usage.output_tokens}"
-            )
-            
-            # Validate JSON
-            try:
-                json.loads(response_text)  # Validate it's valid JSON
-                return response_text
-            except json.JSONDecodeError as e:
-                self.logger.error(f"API returned invalid JSON: {e}")
-                # Try to extract JSON from response
-                return self._extract_json(response_text)
-                
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+                    if scanner.feed(text):
+                        break
+                usage = stream.current_message_snapshot.usage
+        except RateLimitError as e:
+            raise AnthropicRateLimitError(str(e), _retry_after(e)) from e
         except Exception as e:
-            self.logger.error(f"Anthropic API call failed: {e}")
-            # Fallback to mock in case of API error
-            self.logger.warning("Falling back to mock response due to API error")
-            return await self._generate_mock(prompt, max_tokens)
+            raise AnthropicAPIError(str(e)) from e
+        
+        # Extract text content
+        response_text = "".join(chunks)
+        if scanner.complete:
+            response_text = response_text[scanner.start:scanner.end]
+        return response_text, usage
     
-    def _extract_json(self, text: str) -> str:
-        """Extract JSON from text that might have extra content"""
-        import re
+    def _extract_json(self, text: str, max_chars: Optional[int] = None) -> str:
+        """
+        Extract JSON from text that might have extra content
+        
+        Args:
+            text: Raw model output
+            max_chars: Reject candidate JSON longer than this many characters
+        """
+        candidates = []
+        
+        # Surrounding whitespace is the most common reason parsing failed
+        candidates.append(text.strip())
+        
+        # First balanced object, which skips braces inside strings
+        json_str = _find_json_object(text)
+        if json_str is not None:
+            candidates.append(json_str)
         
-        # Try to find JSON object in text
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
+        # Outermost braces
+        start, end = text.find("{"), text.rfind("}")
+        if start != -1 and end > start:
+            candidates.append(text[start:end + 1])
+        
+        for json_str in candidates:
+            if max_chars is not None and len(json_str) > max_chars:
+                continue
             try:
-                json_str = json_match.group(0)
-                json.loads(json_str)  # Validate
+                orjson.loads(json_str)  # Validate
                 return json_str
-            except:
+            except orjson.JSONDecodeError:
                 pass
         
         # If extraction fails, return error JSON
-        return json.dumps({
-            "status": "failed",
-            "action": "json_extraction_failed",
-            "result_summary": "Could not extract valid JSON from AI response",
-            "result": {},
-            "assumptions": ["AI response was not valid JSON"],
-            "confidence": 0.0,
-            "next_steps": ["retry_with_clearer_prompt"]
-        })
+        return _EXTRACTION_FAILED_JSON
     
     async def _generate_mock(self, prompt: str, max_tokens: int) -> str:
         """Generate mock response for testing (same as before)"""
-        self.logger.info(f"Generating MOCK response (max_tokens={max_tokens})")
+        self.logger.info("Generating MOCK response (max_tokens=%s)", max_tokens)
         
-        import re
+        # Detect agent type from prompt and return realistic data. A single
+        # scan finds every marker; the highest-priority one wins.
+        matched = {match.lastindex for match in _MOCK_PROMPT_RE.finditer(prompt)}
+        if matched:
+            return getattr(self, _MOCK_BUILDERS[min(matched) - 1])(prompt)
         
-        # Detect agent type from prompt and return realistic data
-        if "site architecture" in prompt.lower():
-            return self._generate_planning_response(prompt)
-        elif "generate production-ready wordpress content" in prompt.lower():
-            return self._generate_content_response(prompt)
-        elif "blog posts" in prompt.lower():
-            return self._generate_posts_response(prompt)
-        else:
-            return json.dumps({
-                "status": "ok",
-                "action": "generic_action",
-                "result_summary": "Generic mock result",
-                "result": {},
-                "assumptions": [],
-                "confidence": 0.85,
-                "next_steps": []
-            })
+        return _GENERIC_RESPONSE_JSON
     
     def _extract_business_name(self, prompt: str) -> str:
         """Extract business name from prompt"""
-        import re
-        match = re.search(r"Business name:\s*(.+)", prompt)
+        match = _BIZ_NAME_RE.search(prompt)
         return match.group(1).strip() if match else "Business"
     
     def _generate_planning_response(self, prompt: str) -> str:
         """Generate site planning mock response"""
         business_name = self._extract_business_name(prompt)
-        
-        response = {
-            "status": "ok",
-            "action": "site_architecture_generated",
-            "result_summary": f"Generated architecture for {business_name}",
-            "result": {
-                "site_structure": {
-                    "pages": [
-                        {"title": "Home", "slug": "home", "purpose": "Welcome visitors", "content_themes": ["hero", "services"], "priority": "high", "template": "front-page"},
-                        {"title": "About Us", "slug": "about", "purpose": "Tell story", "content_themes": ["history", "team"], "priority": "high", "template": "default"},
-                        {"title": "Services", "slug": "services", "purpose": "Detail services", "content_themes": ["service_list"], "priority": "high", "template": "default"},
-                        {"title": "Menu", "slug": "menu", "purpose": "Display menu", "content_themes": ["menu_items"], "priority": "high", "template": "default"},
-                        {"title": "Gallery", "slug": "gallery", "purpose": "Showcase photos", "content_themes": ["photos"], "priority": "medium", "template": "default"},
-                        {"title": "Contact", "slug": "contact", "purpose": "Contact info", "content_themes": ["form", "map"], "priority": "high", "template": "default"},
-                        {"title": "Blog", "slug": "blog", "purpose": "News updates", "content_themes": ["posts"], "priority": "medium", "template": "default"}
-                    ],
-                    "menus": [{"location": "primary", "name": "Main Menu", "items": ["Home", "About", "Services", "Contact"]}]
-                },
-                "features": [{"name": "Contact Form", "priority": "high", "implementation": "plugin"}],
-                "plugins": [
-                    {"name": "Contact Form 7", "slug": "contact-form-7", "purpose": "Contact forms", "required": True},
-                    {"name": "Yoast SEO", "slug": "wordpress-seo", "purpose": "SEO", "required": True}
-                ],
-                "content_strategy": {
-                    "post_types": ["posts"],
-                    "initial_categories": ["News", "Updates"],
-                    "suggested_posts": [
-                        {"title": "Welcome", "theme": "introduction"},
-                        {"title": "Our Story", "theme": "history"},
-                        {"title": "Quality Matters", "theme": "values"}
-                    ]
-                },
-                "seo_foundation": {
-                    "primary_keywords": ["restaurant", "pizza", "italian"],
-                    "site_tagline": "Authentic Italian Cuisine",
-                    "meta_description_template": f"{business_name} - Your trusted local business"
-                }
-            },
-            "assumptions": [],
-            "confidence": 0.87,
-            "next_steps": ["generate_content"]
-        }
-        return json.dumps(response)
+        # JSON-escape the name before splicing it into the serialized template
+        escaped_name = orjson.dumps(business_name).decode()[1:-1]
+        return _PLANNING_TEMPLATE_JSON.replace(_BUSINESS_NAME_PLACEHOLDER, escaped_name)
     
     def _generate_content_response(self, prompt: str) -> str:
         """Generate page content mock response"""
-        response = {
-            "pages": [
-                {"title": "Home", "slug": "home", "content_html": "<h1>Welcome</h1><p>Experience authentic cuisine...</p>", "seo": {"title": "Home", "meta_description": "Welcome to our restaurant", "slug": "home", "focus_keyword": "restaurant"}},
-                {"title": "About Us", "slug": "about", "content_html": "<h1>Our Story</h1><p>Since 1985...</p>", "seo": {"title": "About", "meta_description": "Our story", "slug": "about", "focus_keyword": "about"}},
-                {"title": "Menu", "slug": "menu", "content_html": "<h1>Menu</h1><p>Delicious dishes...</p>", "seo": {"title": "Menu", "meta_description": "Our menu", "slug": "menu", "focus_keyword": "menu"}},
-                {"title": "Contact", "slug": "contact", "content_html": "<h1>Contact</h1><p>Get in touch...</p>", "seo": {"title": "Contact", "meta_description": "Contact us", "slug": "contact", "focus_keyword": "contact"}}
-            ]
-        }
-        return json.dumps(response)
+        return _CONTENT_RESPONSE_JSON
     
     def _generate_posts_response(self, prompt: str) -> str:
         """Generate blog posts mock response"""
-        response = {
-            "posts": [
-                {"title": "Welcome", "slug": "welcome", "content_html": "<p>Welcome post...</p>", "excerpt": "Welcome", "categories": ["News"], "tags": ["welcome"]},
-                {"title": "Our Story", "slug": "our-story", "content_html": "<p>Our journey...</p>", "excerpt": "Our story", "categories": ["News"], "tags": ["history"]},
-                {"title": "Quality", "slug": "quality", "content_html": "<p>Quality matters...</p>", "excerpt": "Quality", "categories": ["Updates"], "tags": ["quality"]}
-            ]
-        }
-        return json.dumps(response)
+        return _POSTS_RESPONSE_JSON
 
 
 # Convenience function to create client
@@ -0,0 +1,523 @@
+"""
+gsWstudio.ai - FastAPI Application Factory
+Shared models, endpoints and job processing for the HTTP and HTTPS servers
+"""
+
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict, Any
+import asyncio
+import logging
+import os
+import uuid
+import orjson
+from datetime import datetime, timezone
+from dotenv import load_dotenv
+
+# Import ZipWP framework
+from zipwp_python_framework import (
+    GSWStudioPlatform, BusinessInput, configure_logging, close_wp_connector
+)
+from ai_client import create_ai_client
+from job_store import create_job_store, ProgressBuffer
+
+# Load environment
+load_dotenv()
+
+# Configure logging (records are written by a background thread)
+configure_logging(os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
+
+# SSL certificate locations (see generate_ssl.sh)
+SSL_KEYFILE = "ssl/key.pem"
+SSL_CERTFILE = "ssl/cert.pem"
+
+
+def _ssl_available() -> bool:
+    """True if both the SSL key and certificate exist"""
+    try:
+        os.stat(SSL_KEYFILE)
+        os.stat(SSL_CERTFILE)
+        return True
+    except OSError:
+        return False
+
+
+# Checked once at import so the server config and the reported status agree
+SSL_ENABLED = _ssl_available()
+
+# Job status storage (Redis when REDIS_URL is set, otherwise in-memory)
+JOB_SWEEP_INTERVAL = 60  # seconds
+
+# "arq" runs jobs in separate worker processes (see worker.py); anything
+# else runs them as background tasks inside the API process
+JOB_QUEUE = os.getenv("JOB_QUEUE", "background")
+
+job_store = create_job_store()
+progress_buffer = ProgressBuffer(job_store)
+
+
+def _isoformat(ts: float) -> str:
+    """Render a job timestamp (seconds since epoch) for API responses"""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+def _job_progress(job_id: str, job: Dict[str, Any]) -> Dict[str, Any]:
+    """Status fields of a job as returned by the API (everything but the result)"""
+    return {
+        "job_id": job_id,
+        "status": job["status"],
+        "progress": job["progress"],
+        "message": job["message"],
+        "created_at": _isoformat(job["created_ts"]),
+        "updated_at": _isoformat(job["updated_ts"])
+    }
+
+
+# ============================================================================
+# REQUEST/RESPONSE MODELS
+# ============================================================================
+
+class SiteGenerationRequest(BaseModel):
+    """Request model for site generation"""
+    business_name: str = Field(..., description="Name of the business")
+    business_type: str = Field(..., description="Type of business (e.g., restaurant, dental, law)")
+    description: Optional[str] = Field(None, description="Business description")
+    industry: Optional[str] = Field(None, description="Industry category")
+    target_audience: Optional[str] = Field("general public", description="Target audience")
+    goals: Optional[List[str]] = Field(None, description="Business goals")
+    tone: Optional[str] = Field("professional and approachable", description="Content tone")
+    design_preference: Optional[str] = Field("modern and clean", description="Design preference")
+
+    # Deployment options
+    deploy: bool = Field(False, description="Whether to deploy to WordPress")
+    wp_site_url: Optional[str] = Field(None, description="WordPress site URL")
+    wp_username: Optional[str] = Field(None, description="WordPress admin username")
+    wp_password: Optional[str] = Field(None, description="WordPress application password")
+    wp_ssh_host: Optional[str] = Field(None, description="SSH host for WP-CLI")
+    wp_ssh_user: Optional[str] = Field(None, description="SSH username")
+    wp_ssh_key: Optional[str] = Field(None, description="Path to SSH private key")
+
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "business_name": "Joe's Pizza",
+            "business_type": "restaurant",
+            "description": "Family-owned pizza restaurant in Brooklyn",
+            "deploy": False
+        }
+    })
+
+
+class SiteGenerationResponse(BaseModel):
+    """Response model for site generation"""
+    job_id: str
+    status: str
+    message: str
+    result: Optional[Dict[str, Any]] = None
+
+
+class JobProgressResponse(BaseModel):
+    """Response model for job progress (status without the result)"""
+    job_id: str
+    status: str
+    progress: int
+    message: str
+    created_at: str
+    updated_at: str
+
+
+class JobStatusResponse(JobProgressResponse):
+    """Response model for job status"""
+    result: Optional[Dict[str, Any]] = None
+
+
+# ============================================================================
+# APP FACTORY
+# ============================================================================
+
+def create_app(enable_https: bool = False) -> FastAPI:
+    """
+    Create the FastAPI application
+
+    Args:
+        enable_https: If True, report SSL status and allow the HTTPS
+                      frontend origin by default
+
+    Returns:
+        Configured FastAPI app
+    """
+    app = FastAPI(
+        title="gsWstudio.ai API",
+        description=(
+            "Autonomous WordPress site generation API with HTTPS support"
+            if enable_https else
+            "Autonomous WordPress site generation API"
+        ),
+        version="1.0.0",
+        default_response_class=ORJSONResponse
+    )
+
+    # CORS configuration
+    default_origins = "http://localhost:3002,http://localhost:3000"
+    if enable_https:
+        default_origins = "https://localhost:3002," + default_origins
+    cors_origins = os.getenv("API_CORS_ORIGINS", default_origins).split(",")
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Compress larger JSON payloads (job results embed the whole generated site)
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+    # ------------------------------------------------------------------------
+    # API ENDPOINTS
+    # ------------------------------------------------------------------------
+
+    @app.get("/")
+    async def root():
+        """Root endpoint"""
+        info = {
+            "name": "gsWstudio.ai API",
+            "version": "1.0.0",
+            "status": "operational",
+        }
+        if enable_https:
+            info["protocol"] = "HTTPS" if SSL_ENABLED else "HTTP"
+        info["endpoints"] = {
+            "health": "/health",
+            "generate_site": "/api/v1/sites/generate",
+            "job_status": "/api/v1/jobs/{job_id}",
+            "job_progress": "/api/v1/jobs/{job_id}/status",
+            "job_result": "/api/v1/jobs/{job_id}/result",
+            "docs": "/docs"
+        }
+        return info
+
+    @app.get("/health")
+    async def health_check():
+        """Health check endpoint"""
+        health = {
+            "status": "healthy",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "ai_mode": "real" if os.getenv("ANTHROPIC_API_KEY") else "mock"
+        }
+        if enable_https:
+            health["ssl_enabled"] = SSL_ENABLED
+        return health
+
+    @app.post("/api/v1/sites/generate", response_model=SiteGenerationResponse)
+    async def generate_site(
+        request: SiteGenerationRequest,
+        background_tasks: BackgroundTasks
+    ):
+        """
+        Generate a WordPress site
+
+        This endpoint starts an asynchronous site generation job.
+        Use the returned job_id to check status via /api/v1/jobs/{job_id}
+        """
+        try:
+            # Generate unique job ID
+            job_id = str(uuid.uuid4())
+
+            # Initialize job (timestamps are rendered as ISO strings on read)
+            await job_store.create(
+                job_id,
+                status="queued",
+                progress=0,
+                message="Job queued",
+                result=None
+            )
+
+            # Hand off to the worker queue, or run in this process
+            if app.state.job_queue is not None:
+                await app.state.job_queue.enqueue_job(
+                    "generate_site_task",
+                    job_id,
+                    request.model_dump(),
+                    _job_id=job_id
+                )
+            else:
+                background_tasks.add_task(
+                    process_site_generation,
+                    job_id,
+                    request,
+                    app.state.platform
+                )
+
+            logger.info("Site generation job created: %s", job_id)
+
+            return SiteGenerationResponse(
+                job_id=job_id,
+                status="queued",
+                message="Site generation job started. Use job_id to check status.",
+                result=None
+            )
+
+        except Exception as e:
+            logger.error("Failed to create site generation job: %s", e)
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @app.get("/api/v1/jobs/{job_id}", response_model=JobStatusResponse)
+    async def get_job_status(job_id: str):
+        """
+        Get status of a site generation job
+
+        Returns current status, progress, and results (if completed)
+        """
+        job = await job_store.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        # The stored result is already encoded JSON; orjson.Fragment embeds it
+        # verbatim instead of decoding and re-encoding it. Returning the
+        # response directly skips response_model validation, but the body
+        # has exactly the JobStatusResponse shape.
+        payload = _job_progress(job_id, job)
+        payload["result"] = orjson.Fragment(job["result"]) if job["result"] else None
+        return ORJSONResponse(payload)
+
+    @app.get("/api/v1/jobs/{job_id}/status", response_model=JobProgressResponse)
+    async def get_job_progress(job_id: str):
+        """
+        Get status and progress of a job without its result
+
+        Cheap enough to poll; fetch /api/v1/jobs/{job_id}/result once completed
+        """
+        job = await job_store.get(job_id, include_result=False)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        return _job_progress(job_id, job)
+
+    @app.get("/api/v1/jobs/{job_id}/result")
+    async def get_job_result(job_id: str):
+        """Get the generated site of a completed job"""
+        job = await job_store.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if job["status"] != "completed" or job["result"] is None:
+            raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+
+        return Response(content=job["result"], media_type="application/json")
+
+    @app.delete("/api/v1/jobs/{job_id}")
+    async def delete_job(job_id: str):
+        """Delete a completed job"""
+        if not await job_store.delete(job_id):
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        return {"message": "Job deleted successfully"}
+
+    @app.get("/api/v1/jobs")
+    async def list_jobs(
+        limit: Optional[int] = Query(None, ge=1, description="Maximum jobs to return"),
+        status: Optional[str] = Query(None, description="Only return jobs with this status")
+    ):
+        """List all jobs"""
+        total, selected = await job_store.list(limit=limit, status=status)
+        return {
+            "total": total,
+            "jobs": [
+                {
+                    "job_id": job_id,
+                    "status": job["status"],
+                    "progress": job["progress"],
+                    "created_at": _isoformat(job["created_ts"])
+                }
+                for job_id, job in selected
+            ]
+        }
+
+    # ------------------------------------------------------------------------
+    # STARTUP/SHUTDOWN
+    # ------------------------------------------------------------------------
+
+    @app.on_event("startup")
+    async def startup_event():
+        """Run on server startup"""
+        logger.info("gsWstudio.ai API starting...")
+        # One AI client and platform for the process; the platform keeps no
+        # per-job state, so every job reuses the client's connection pool
+        app.state.ai_client = create_ai_client()
+        app.state.platform = GSWStudioPlatform(
+            ai_api_key=os.getenv("ANTHROPIC_API_KEY", "mock"),
+            ai_client=app.state.ai_client
+        )
+        app.state.job_sweeper = asyncio.create_task(sweep_jobs())
+        app.state.job_queue = await create_job_queue()
+        logger.info("AI Mode: %s", "Real API" if os.getenv("ANTHROPIC_API_KEY") else "Mock")
+        if enable_https:
+            logger.info("SSL: %s", "Enabled" if SSL_ENABLED else "Disabled")
+        logger.info("CORS Origins: %s", cors_origins)
+
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """Run on server shutdown"""
+        logger.info("gsWstudio.ai API shutting down...")
+        app.state.job_sweeper.cancel()
+        if app.state.job_queue is not None:
+            await app.state.job_queue.aclose()
+        await progress_buffer.flush()
+        await job_store.close()
+        await app.state.ai_client.aclose()
+        await close_wp_connector()
+
+    return app
+
+
+# ============================================================================
+# BACKGROUND TASKS
+# ============================================================================
+
+async def process_site_generation(
+    job_id: str,
+    request: SiteGenerationRequest,
+    platform: GSWStudioPlatform
+):
+    """
+    Background task to process site generation
+
+    Updates job status as it progresses through the workflow
+    """
+    try:
+        # Update status: Starting
+        await progress_buffer.update(
+            job_id,
+            status="processing",
+            progress=10,
+            message="Initializing platform..."
+        )
+
+        # Prepare hosting info if deployment requested
+        hosting_info = None
+        if request.deploy and request.wp_site_url:
+            hosting_info = {
+                "wp_credentials": {
+                    "site_url": request.wp_site_url,
+                    "username": request.wp_username,
+                    "password": request.wp_password,
+                    "ssh_host": request.wp_ssh_host,
+                    "ssh_user": request.wp_ssh_user,
+                    "ssh_key": request.wp_ssh_key
+                }
+            }
+
+        # Update status: Planning
+        await progress_buffer.update(
+            job_id,
+            progress=20,
+            message="Generating site architecture..."
+        )
+
+        # Generate site
+        result = await platform.create_site(
+            business_name=request.business_name,
+            business_type=request.business_type,
+            description=request.description,
+            hosting_info=hosting_info
+        )
+
+        # Update status: Completed (the result is stored as encoded JSON)
+        await progress_buffer.update(
+            job_id,
+            status="completed",
+            progress=100,
+            message="Site generation completed successfully",
+            result=orjson.dumps(result)
+        )
+
+        logger.info("Job %s completed successfully", job_id)
+
+    except Exception as e:
+        logger.error("Job %s failed: %s", job_id, e)
+        await progress_buffer.update(
+            job_id,
+            status="failed",
+            progress=0,
+            message=f"Error: {str(e)}"
+        )
+
+
+async def create_job_queue():
+    """Connect to the arq queue when JOB_QUEUE=arq, otherwise return None"""
+    if JOB_QUEUE != "arq":
+        return None
+
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        raise RuntimeError("JOB_QUEUE=arq requires REDIS_URL so workers can share job status")
+
+    from arq import create_pool
+    from arq.connections import RedisSettings
+
+    logger.info("Queueing site generation jobs for arq workers")
+    return await create_pool(RedisSettings.from_dsn(redis_url))
+
+
+async def sweep_jobs():
+    """Periodically drop finished jobs older than the job TTL"""
+    while True:
+        await asyncio.sleep(JOB_SWEEP_INTERVAL)
+        swept = await job_store.sweep()
+        if swept:
+            logger.info("Swept %s expired jobs", swept)
+
+
+# ============================================================================
+# RUN SERVER
+# ============================================================================
+
+def run(
+    app_path: str,
+    ssl_keyfile: Optional[str] = None,
+    ssl_certfile: Optional[str] = None,
+    **uvicorn_options
+):
+    """Serve app_path ("module:app") with uvicorn, configured from the environment"""
+    import uvicorn
+
+    host = os.getenv("API_HOST", "0.0.0.0")
+    port = int(os.getenv("API_PORT", "8000"))
+
+    # Prefer uvloop's libuv-backed event loop and the C HTTP parser (both
+    # ship with uvicorn[standard]); fall back where unavailable (e.g. Windows)
+    try:
+        import uvloop  # noqa: F401
+        uvicorn_options.setdefault("loop", "uvloop")
+    except ImportError:
+        uvicorn_options.setdefault("loop", "asyncio")
+    try:
+        import httptools  # noqa: F401
+        uvicorn_options.setdefault("http", "httptools")
+    except ImportError:
+        uvicorn_options.setdefault("http", "h11")
+
+    # Auto-reload is for development only; production scales with workers.
+    # Without REDIS_URL jobs are stored per process, so only one worker is
+    # started by default; with Redis, default to one worker per CPU.
+    if os.getenv("ENV") == "dev":
+        uvicorn_options["reload"] = True
+    else:
+        default_workers = (os.cpu_count() or 2) if os.getenv("REDIS_URL") else 1
+        uvicorn_options["workers"] = int(os.getenv("API_WORKERS", str(default_workers)))
+
+    scheme = "https" if ssl_keyfile else "http"
+    logger.info("Starting server on %s://%s:%s", scheme, host, port)
+
+    uvicorn.run(
+        app_path,
+        host=host,
+        port=port,
+        log_level="info",
+        ssl_keyfile=ssl_keyfile,
+        ssl_certfile=ssl_certfile,
+        **uvicorn_options
+    )
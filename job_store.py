@@ -0,0 +1,307 @@
+"""
+gsWstudio.ai - Job Status Storage
+In-memory store for single-process deployments, Redis for shared state
+"""
+
+import os
+import time
+import asyncio
+import logging
+import itertools
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bounded LRU: once MAX_JOBS is exceeded the least recently read finished
+# job is evicted, and finished jobs expire after JOB_TTL seconds
+MAX_JOBS = int(os.getenv("MAX_JOBS", "4096"))
+JOB_TTL = int(os.getenv("JOB_TTL", "3600"))
+
+# Progress updates are coalesced and written at most once per interval
+# (seconds); 0 writes every update immediately
+PROGRESS_FLUSH_INTERVAL = float(os.getenv("PROGRESS_FLUSH_INTERVAL", "0.5"))
+
+FINISHED_STATUSES = ("completed", "failed")
+
+# Everything except "result", which holds the job's encoded JSON payload (bytes)
+STATUS_FIELDS = ("status", "progress", "message", "created_ts", "updated_ts")
+
+# HSET only if the job hash still exists, so late updates can't recreate an
+# expired or deleted job. KEYS[1] is the job hash, ARGV[1] the TTL to set
+# (0 for none) and the rest field/value pairs.
+_UPDATE_IF_EXISTS_LUA = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+redis.call("HSET", KEYS[1], unpack(ARGV, 2))
+if tonumber(ARGV[1]) > 0 then
+    redis.call("EXPIRE", KEYS[1], ARGV[1])
+end
+return 1
+"""
+
+
+class MemoryJobStore:
+    """
+    In-process job store (state is lost on restart and not shared by workers)
+
+    Jobs are kept in least-recently-read order. Queued and running jobs are
+    never evicted, so the store can briefly exceed max_jobs while they finish.
+    """
+
+    def __init__(self, max_jobs: int = MAX_JOBS, ttl: int = JOB_TTL):
+        self.max_jobs = max_jobs
+        self.ttl = ttl
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    async def create(self, job_id: str, **fields) -> None:
+        """Add a job, evicting least recently read finished jobs beyond max_jobs"""
+        now = time.time()
+        self._jobs[job_id] = dict(fields, created_ts=now, updated_ts=now)
+        self._evict()
+
+    def _evict(self) -> None:
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        finished = (
+            job_id for job_id, job in self._jobs.items()
+            if job["status"] in FINISHED_STATUSES
+        )
+        for job_id in list(itertools.islice(finished, excess)):
+            del self._jobs[job_id]
+
+    async def update(self, job_id: str, **fields) -> None:
+        """Update job fields; a no-op if the job was evicted or deleted"""
+        await self.update_many({job_id: fields})
+
+    async def update_many(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """Apply {job_id: fields} updates, stamped with a single timestamp"""
+        now = time.time()
+        for job_id, fields in updates.items():
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+                job["updated_ts"] = now
+
+    async def get(self, job_id: str, include_result: bool = True) -> Optional[Dict[str, Any]]:
+        """Fetch a job and mark it most recently read"""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            self._jobs.move_to_end(job_id)
+        return job
+
+    async def delete(self, job_id: str) -> bool:
+        return self._jobs.pop(job_id, None) is not None
+
+    async def list(
+        self, limit: Optional[int] = None, status: Optional[str] = None
+    ) -> Tuple[int, List[Tuple[str, Dict[str, Any]]]]:
+        """Return (total job count, [(job_id, job)]) in creation order"""
+        # Reads reorder self._jobs, so restore creation order first
+        jobs = sorted(self._jobs.items(), key=lambda item: item[1]["created_ts"])
+        selected = (
+            (job_id, job) for job_id, job in jobs
+            if status is None or job["status"] == status
+        )
+        return len(jobs), list(itertools.islice(selected, limit))
+
+    async def sweep(self) -> int:
+        """Drop finished jobs older than ttl, returning how many were removed"""
+        cutoff = time.time() - self.ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job["status"] in FINISHED_STATUSES and job["updated_ts"] < cutoff
+        ]
+        for job_id in expired:
+            self._jobs.pop(job_id, None)
+        return len(expired)
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisJobStore:
+    """
+    Redis-backed job store shared by all API workers
+
+    Each job is a hash at job:{job_id}; job ids are kept in the jobs:index set.
+    Finished jobs expire after ttl seconds.
+    """
+
+    KEY_PREFIX = "job:"
+    INDEX_KEY = "jobs:index"
+
+    def __init__(self, url: str, ttl: int = JOB_TTL):
+        import redis.asyncio as redis
+
+        self.ttl = ttl
+        self.redis = redis.from_url(url, decode_responses=True)
+        self._update_if_exists = self.redis.register_script(_UPDATE_IF_EXISTS_LUA)
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}{job_id}"
+
+    @staticmethod
+    def _encode(fields: Dict[str, Any]) -> Dict[str, str]:
+        encoded = {}
+        for name, value in fields.items():
+            if name == "result":
+                # Already JSON; stored verbatim so reads never re-serialize it
+                encoded[name] = "" if value is None else value.decode()
+            else:
+                encoded[name] = str(value)
+        return encoded
+
+    @staticmethod
+    def _decode(raw: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        result = raw.get("result")
+        return {
+            "status": raw.get("status") or "unknown",
+            "progress": int(raw.get("progress") or 0),
+            "message": raw.get("message") or "",
+            "result": result.encode() if result else None,
+            "created_ts": float(raw.get("created_ts") or 0),
+            "updated_ts": float(raw.get("updated_ts") or 0),
+        }
+
+    async def create(self, job_id: str, **fields) -> None:
+        now = time.time()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(
+                self._key(job_id),
+                mapping=self._encode(dict(fields, created_ts=now, updated_ts=now))
+            )
+            pipe.sadd(self.INDEX_KEY, job_id)
+            await pipe.execute()
+
+    async def update(self, job_id: str, **fields) -> None:
+        """Update job fields in one round-trip"""
+        await self.update_many({job_id: fields})
+
+    async def update_many(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Apply {job_id: fields} updates in one pipelined round-trip
+
+        Jobs that expired or were deleted are skipped, as in MemoryJobStore.
+        """
+        now = time.time()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id, fields in updates.items():
+                ttl = self.ttl if fields.get("status") in FINISHED_STATUSES else 0
+                args = [ttl]
+                for name, value in self._encode(dict(fields, updated_ts=now)).items():
+                    args += (name, value)
+                await self._update_if_exists(keys=[self._key(job_id)], args=args, client=pipe)
+            await pipe.execute()
+
+    async def get(self, job_id: str, include_result: bool = True) -> Optional[Dict[str, Any]]:
+        """Fetch a job; include_result=False skips transferring the result payload"""
+        if include_result:
+            raw = await self.redis.hgetall(self._key(job_id))
+        else:
+            values = await self.redis.hmget(self._key(job_id), STATUS_FIELDS)
+            raw = dict(zip(STATUS_FIELDS, values)) if any(values) else {}
+        return self._decode(raw) if raw else None
+
+    async def delete(self, job_id: str) -> bool:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.delete(self._key(job_id))
+            pipe.srem(self.INDEX_KEY, job_id)
+            deleted, _ = await pipe.execute()
+        return deleted > 0
+
+    async def list(
+        self, limit: Optional[int] = None, status: Optional[str] = None
+    ) -> Tuple[int, List[Tuple[str, Dict[str, Any]]]]:
+        """Return (total job count, [(job_id, job)]) in creation order"""
+        job_ids = [job_id async for job_id in self.redis.sscan_iter(self.INDEX_KEY)]
+
+        # One round-trip for all jobs, skipping the (large) result payloads
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.hmget(self._key(job_id), STATUS_FIELDS)
+            rows = await pipe.execute()
+
+        jobs = []
+        expired = []
+        for job_id, values in zip(job_ids, rows):
+            if any(values):
+                jobs.append((job_id, self._decode(dict(zip(STATUS_FIELDS, values)))))
+            else:
+                expired.append(job_id)
+        if expired:
+            await self.redis.srem(self.INDEX_KEY, *expired)
+
+        jobs.sort(key=lambda item: item[1]["created_ts"])
+        selected = (
+            item for item in jobs
+            if status is None or item[1]["status"] == status
+        )
+        return len(jobs), list(itertools.islice(selected, limit))
+
+    async def sweep(self) -> int:
+        # Finished jobs expire in Redis; stale index entries are pruned by list()
+        return 0
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+class ProgressBuffer:
+    """
+    Coalesce job updates and write them at most once per interval
+
+    Updates that finish a job (completed/failed) are written immediately
+    together with anything still pending, so clients never wait on the
+    timer for a final result.
+    """
+
+    def __init__(self, store, interval: float = PROGRESS_FLUSH_INTERVAL):
+        self.store = store
+        self.interval = interval
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._lock = asyncio.Lock()
+
+    async def update(self, job_id: str, **fields) -> None:
+        """Merge fields into the pending update for job_id"""
+        self._pending.setdefault(job_id, {}).update(fields)
+
+        if self.interval <= 0 or fields.get("status") in FINISHED_STATUSES:
+            await self.flush()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.interval, self._flush_soon)
+
+    def _flush_soon(self) -> None:
+        self._timer = None
+        task = asyncio.ensure_future(self.flush())
+        task.add_done_callback(self._log_flush_error)
+
+    @staticmethod
+    def _log_flush_error(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception():
+            logger.error("Failed to flush job updates: %s", task.exception())
+
+    async def flush(self) -> None:
+        """Write all pending updates now"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # Serialize writes so a late timer flush can't overwrite a newer update
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            if pending:
+                await self.store.update_many(pending)
+
+
+def create_job_store():
+    """Use Redis when REDIS_URL is set, otherwise keep jobs in memory"""
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        logger.info("Using Redis job store")
+        return RedisJobStore(redis_url)
+    return MemoryJobStore()
@@ -0,0 +1,130 @@
+"""
+Test script for AI client JSON extraction
+Checks the brace-matching scanner used to cut streamed responses short
+"""
+
+import asyncio
+import sys
+import os
+import orjson
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_client import (
+    JsonObjectScanner, ProductionAIClient, _find_json_object, _EXTRACTION_FAILED_JSON
+)
+
+
+def test_braces_inside_strings():
+    """Braces in string values don't open or close the object"""
+    text = '{"title": "Use {curly} braces", "end": "}"} trailing }'
+    assert _find_json_object(text) == '{"title": "Use {curly} braces", "end": "}"}'
+
+
+def test_escaped_quotes():
+    """Escaped quotes don't end a string early"""
+    text = r'{"quote": "She said \"hi {there}\"", "path": "C:\\"} after'
+    json_str = _find_json_object(text)
+    assert json_str == r'{"quote": "She said \"hi {there}\"", "path": "C:\\"}'
+    assert orjson.loads(json_str)["path"] == "C:\\"
+
+
+def test_leading_prose():
+    """Text before the first brace is skipped"""
+    text = 'Here is the plan you asked for:\n{"status": "ok", "result": {"pages": [1, 2]}}\nThanks!'
+    assert _find_json_object(text) == '{"status": "ok", "result": {"pages": [1, 2]}}'
+
+
+def test_streamed_chunks():
+    """The object is found across chunk boundaries, including mid-escape"""
+    scanner = JsonObjectScanner()
+    chunks = ['Sure: {"a": "x\\', '"y", "b": [{', '}]}', ' ignored']
+    text = ""
+    for chunk in chunks:
+        text += chunk
+        if scanner.feed(chunk):
+            break
+    assert scanner.complete
+    assert text[scanner.start:scanner.end] == '{"a": "x\\"y", "b": [{}]}'
+
+
+def test_incomplete_and_mismatched():
+    """Unclosed objects and mismatched brackets yield no object"""
+    assert _find_json_object('prose {"a": [1, 2') is None
+    assert _find_json_object("no json here") is None
+
+    scanner = JsonObjectScanner()
+    assert not scanner.feed('{"a": [1}')
+    assert not scanner.complete
+
+
+def test_braced_preamble():
+    """Bracketed prose that isn't JSON is skipped, not returned"""
+    text = 'Filled in {the} template (see [1}):\n{"status": "ok", "n": 1}'
+    assert _find_json_object(text) == '{"status": "ok", "n": 1}'
+
+    chunks = ["Here is {the", '} plan: {"status": ', '"ok"} done']
+    scanner = JsonObjectScanner()
+    assert not scanner.feed(chunks[0])
+    assert not scanner.feed(chunks[1])
+    assert scanner.feed(chunks[2])
+    assert "".join(chunks)[scanner.start:scanner.end] == '{"status": "ok"}'
+
+
+class _FakeStream:
+    """Minimal stand-in for the Anthropic streaming context manager"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.sent = 0
+        self.current_message_snapshot = type("Message", (), {"usage": None})()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+
+def test_stream_keeps_reading_past_braced_preamble():
+    """_stream_json only stops once a parseable object closes"""
+    stream = _FakeStream(["Using {the} ", 'schema: {"status": ', '"ok"}', " trailing", " text"])
+    client = ProductionAIClient(use_mock=True)
+    client.client = type("Client", (), {})()
+    client.client.messages = type("Messages", (), {"stream": lambda self, **kwargs: stream})()
+
+    text, _ = asyncio.run(client._stream_json("prompt", 0.1, 0.8, 600, "system"))
+    assert text == '{"status": "ok"}'
+    assert stream.sent == 3
+
+
+def test_extract_json():
+    """_extract_json returns valid JSON or the extraction-failed response"""
+    client = ProductionAIClient(use_mock=True)
+    assert client._extract_json('Result:\n{"ok": "{yes}"}\n') == '{"ok": "{yes}"}'
+    assert client._extract_json('{"ok": true}', max_chars=5) == _EXTRACTION_FAILED_JSON
+    assert client._extract_json("not json") == _EXTRACTION_FAILED_JSON
+
+
+if __name__ == "__main__":
+    tests = [
+        test_braces_inside_strings,
+        test_escaped_quotes,
+        test_leading_prose,
+        test_streamed_chunks,
+        test_incomplete_and_mismatched,
+        test_braced_preamble,
+        test_stream_keeps_reading_past_braced_preamble,
+        test_extract_json,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    print(f"\nAll {len(tests)} tests passed")
@@ -5,8 +5,8 @@ Tests the complete flow: Frontend API → FastAPI → Python Backend
 
 import asyncio
 import aiohttp
-import json
 import time
+import orjson
 from typing import Dict, Any
 
 # Configuration
@@ -15,30 +15,27 @@ FASTAPI_URL = "https://localhost:8000"
 NEXTJS_API_URL = "http://localhost:3002/api"
 
 
-async def test_fastapi_health():
+async def test_fastapi_health(session: aiohttp.ClientSession):
     """Test FastAPI health endpoint"""
     print("=" * 60)
     print("TEST 1: FastAPI Health Check")
     print("=" * 60)
     
-    # Use ssl=False for self-signed certificates
-    connector = aiohttp.TCPConnector(ssl=False)
-    async with aiohttp.ClientSession(connector=connector) as session:
-        async with session.get(f"{FASTAPI_URL}/health") as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                print("✅ FastAPI is healthy")
-                print(f"   Status: {data['status']}")
-                print(f"   AI Mode: {data['ai_mode']}")
-                print(f"   Timestamp: {data['timestamp']}")
-                print(f"   SSL Enabled: {data.get('ssl_enabled', False)}")
-                return True
-            else:
-                print(f"❌ FastAPI health check failed: {resp.status}")
-                return False
-
-
-async def test_site_generation():
+    async with session.get(f"{FASTAPI_URL}/health") as resp:
+        if resp.status == 200:
+            data = await resp.json()
+            print("✅ FastAPI is healthy")
+            print(f"   Status: {data['status']}")
+            print(f"   AI Mode: {data['ai_mode']}")
+            print(f"   Timestamp: {data['timestamp']}")
+            print(f"   SSL Enabled: {data.get('ssl_enabled', False)}")
+            return True
+        else:
+            print(f"❌ FastAPI health check failed: {resp.status}")
+            return False
+
+
+async def test_site_generation(session: aiohttp.ClientSession):
     """Test site generation via FastAPI"""
     print("\n" + "=" * 60)
     print("TEST 2: Site Generation (FastAPI Direct)")
@@ -51,49 +48,59 @@ async def test_site_generation():
         "deploy": False
     }
     
-    print(f"\nRequest: {json.dumps(request_data, indent=2)}")
+    print(f"\nRequest: {orjson.dumps(request_data, option=orjson.OPT_INDENT_2).decode()}")
     
-    connector = aiohttp.TCPConnector(ssl=False)
-    async with aiohttp.ClientSession(connector=connector) as session:
-        # Start generation
-        async with session.post(
-            f"{FASTAPI_URL}/api/v1/sites/generate",
-            json=request_data
-        ) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                job_id = data['job_id']
-                print(f"\n✅ Job created: {job_id}")
-                print(f"   Status: {data['status']}")
-                print(f"   Message: {data['message']}")
-                
-                # Poll for completion
-                print("\n⏳ Polling for completion...")
-                return await poll_job_status(session, job_id)
-            else:
-                error = await resp.text()
-                print(f"❌ Failed to create job: {resp.status}")
-                print(f"   Error: {error}")
-                return False
-
-
-async def poll_job_status(session: aiohttp.ClientSession, job_id: str, max_attempts: int = 30) -> bool:
-    """Poll job status until completion"""
-    for attempt in range(max_attempts):
-        await asyncio.sleep(1)  # Wait 1 second between polls
+    # Start generation
+    async with session.post(
+        f"{FASTAPI_URL}/api/v1/sites/generate",
+        json=request_data
+    ) as resp:
+        if resp.status == 200:
+            data = await resp.json()
+            job_id = data['job_id']
+            print(f"\n✅ Job created: {job_id}")
+            print(f"   Status: {data['status']}")
+            print(f"   Message: {data['message']}")
+        else:
+            error = await resp.text()
+            print(f"❌ Failed to create job: {resp.status}")
+            print(f"   Error: {error}")
+            return False
+    
+    # Poll for completion
+    print("\n⏳ Polling for completion...")
+    return await poll_job_status(session, job_id)
+
+
+async def poll_job_status(
+    session: aiohttp.ClientSession,
+    job_id: str,
+    timeout_sec: float = 30.0,
+    min_interval_sec: float = 0.1,
+    max_interval_sec: float = 1.0
+) -> bool:
+    """Poll job status until completion, backing off from min to max interval"""
+    deadline = time.monotonic() + timeout_sec
+    attempt = 0
+    while time.monotonic() < deadline:
+        # Fast jobs are seen quickly; long jobs settle at max_interval_sec
+        await asyncio.sleep(min(max_interval_sec, min_interval_sec * (1.5 ** attempt)))
+        attempt += 1
         
-        async with session.get(f"{FASTAPI_URL}/api/v1/jobs/{job_id}") as resp:
+        # Poll the lightweight status endpoint; the result is fetched once
+        async with session.get(f"{FASTAPI_URL}/api/v1/jobs/{job_id}/status") as resp:
             if resp.status == 200:
                 data = await resp.json()
                 status = data['status']
                 progress = data['progress']
                 message = data['message']
                 
-                print(f"   [{attempt + 1}/{max_attempts}] Status: {status} | Progress: {progress}% | {message}")
+                print(f"   [{attempt}] Status: {status} | Progress: {progress}% | {message}")
                 
                 if status == "completed":
                     print("\n✅ Site generation completed!")
-                    result = data.get('result', {})
+                    async with session.get(f"{FASTAPI_URL}/api/v1/jobs/{job_id}/result") as result_resp:
+                        result = await result_resp.json() if result_resp.status == 200 else {}
                     
                     # Display summary
                     if 'site_summary' in result:
@@ -121,56 +128,52 @@ async def poll_job_status(session: aiohttp.ClientSession, job_id: str, max_attem
                 print(f"   ❌ Failed to get status: {resp.status}")
                 return False
     
-    print(f"\n⏱️ Timeout: Job did not complete in {max_attempts} seconds")
+    print(f"\n⏱️ Timeout: Job did not complete in {timeout_sec:.0f} seconds")
     return False
 
 
-async def test_nextjs_api():
+async def test_nextjs_api(session: aiohttp.ClientSession):
     """Test Next.js API route (if available)"""
     print("\n" + "=" * 60)
     print("TEST 3: Next.js API Route")
     print("=" * 60)
     
     try:
-        # Next.js is HTTP, so no SSL context needed, but we can reuse the connector or create new session
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{NEXTJS_API_URL}/generate-site") as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    print("✅ Next.js API route is accessible")
-                    print(f"   Message: {data.get('message')}")
-                    print(f"   Backend: {data.get('pythonBackend')}")
-                    return True
-                else:
-                    print(f"⚠️  Next.js API route returned: {resp.status}")
-                    return False
+        async with session.get(f"{NEXTJS_API_URL}/generate-site") as resp:
+            if resp.status == 200:
+                data = await resp.json()
+                print("✅ Next.js API route is accessible")
+                print(f"   Message: {data.get('message')}")
+                print(f"   Backend: {data.get('pythonBackend')}")
+                return True
+            else:
+                print(f"⚠️  Next.js API route returned: {resp.status}")
+                return False
     except Exception as e:
         print(f"⚠️  Next.js API not accessible (may not be running): {e}")
         return False
 
 
-async def test_list_jobs():
+async def test_list_jobs(session: aiohttp.ClientSession):
     """Test listing all jobs"""
     print("\n" + "=" * 60)
     print("TEST 4: List All Jobs")
     print("=" * 60)
     
-    connector = aiohttp.TCPConnector(ssl=False)
-    async with aiohttp.ClientSession(connector=connector) as session:
-        async with session.get(f"{FASTAPI_URL}/api/v1/jobs") as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                print(f"✅ Found {data['total']} jobs")
-                
-                if data['jobs']:
-                    print("\n📋 Recent Jobs:")
-                    for job in data['jobs'][:5]:  # Show first 5
-                        print(f"   • {job['job_id'][:8]}... | {job['status']} | {job['progress']}%")
-                
-                return True
-            else:
-                print(f"❌ Failed to list jobs: {resp.status}")
-                return False
+    async with session.get(f"{FASTAPI_URL}/api/v1/jobs") as resp:
+        if resp.status == 200:
+            data = await resp.json()
+            print(f"✅ Found {data['total']} jobs")
+            
+            if data['jobs']:
+                print("\n📋 Recent Jobs:")
+                for job in data['jobs'][:5]:  # Show first 5
+                    print(f"   • {job['job_id'][:8]}... | {job['status']} | {job['progress']}%")
+            
+            return True
+        else:
+            print(f"❌ Failed to list jobs: {resp.status}")
+            return False
 
 
 async def run_all_tests():
@@ -181,12 +184,19 @@ async def run_all_tests():
     
     start_time = time.time()
     
-    results = {
-        "health_check": await test_fastapi_health(),
-        "site_generation": await test_site_generation(),
-        "nextjs_api": await test_nextjs_api(),
-        "list_jobs": await test_list_jobs()
-    }
+    # One session for the whole run so connections are kept alive and reused.
+    # ssl=False accepts the self-signed development certificate.
+    connector = aiohttp.TCPConnector(ssl=False, limit=100, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30)
+    ) as session:
+        results = {
+            "health_check": await test_fastapi_health(session),
+            "site_generation": await test_site_generation(session),
+            "nextjs_api": await test_nextjs_api(session),
+            "list_jobs": await test_list_jobs(session)
+        }
     
     # Summary
     print("\n" + "=" * 60)
@@ -212,6 +222,13 @@ async def run_all_tests():
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     try:
         asyncio.run(run_all_tests())
     except KeyboardInterrupt:
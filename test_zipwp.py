@@ -4,22 +4,22 @@ Runs a simple site generation example
 """
 
 import asyncio
-import json
 import sys
 import os
 import logging
+import orjson
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import framework
-from zipwp_python_framework import GSWStudioPlatform, BusinessInput, AIClient, MockWordPressAPI, MockSSHClient
+from zipwp_python_framework import (
+    GSWStudioPlatform, BusinessInput, AIClient, MockWordPressAPI, MockSSHClient,
+    PluginSelectionAgent, configure_logging
+)
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging(logging.INFO)
 logger = logging.getLogger("ZipWPTest")
 
 
@@ -77,8 +77,8 @@ async def test_restaurant_site():
     
     # Save detailed results to file
     output_file = "zipwp_test_results.json"
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
     
     print(f"✓ Detailed results saved to: {output_file}")
     print()
@@ -105,9 +105,54 @@ async def test_restaurant_site():
     print("=" * 60)
 
 
+async def test_ecommerce_plugin_detection():
+    """WooCommerce is added for whole-word e-commerce features only"""
+    agent = PluginSelectionAgent(AIClient("test-key-mock"))
+    
+    async def selects_woocommerce(features):
+        response = await agent.execute({"features": features})
+        slugs = [p["slug"] for p in response.result["essential_plugins"]]
+        return "woocommerce" in slugs
+    
+    cases = [
+        # (features, expected) - also matched by the old "ecommerce" substring check
+        (["eCommerce checkout"], True),
+        ([{"name": "Cart", "implementation": "ecommerce_plugin"}], True),
+        (["Contact form", "Photo gallery"], False),
+        # Added by token matching
+        ([{"name": "E-commerce", "priority": "high"}], True),
+        (["WooCommerce integration"], True),
+        ([{"name": "Online Store"}], True),
+        (["Gift shop"], True),
+        # No longer matched: "ecommerce" only inside a longer word
+        (["ecommerceplatform"], False),
+        # Not a whole-word match
+        (["Restore backups", "Shopping hours"], False),
+    ]
+    for features, expected in cases:
+        assert await selects_woocommerce(features) == expected, features
+    
+    print("✓ E-commerce plugin detection")
+
+
+async def main():
+    """Run all test cases concurrently"""
+    await asyncio.gather(
+        test_restaurant_site(),
+        test_ecommerce_plugin_detection(),
+    )
+
+
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     try:
-        asyncio.run(test_site_generation())
+        asyncio.run(main())
     except KeyboardInterrupt:
         print("\n\nTest interrupted by user")
     except Exception as e:
@@ -0,0 +1,56 @@
+"""
+gsWstudio.ai - Site Generation Worker
+Runs queued site generation jobs outside the API process (requires arq + Redis)
+
+Run with:
+    arq worker.WorkerSettings
+"""
+
+import os
+from arq.connections import RedisSettings
+
+from api_app import (
+    SiteGenerationRequest,
+    process_site_generation,
+    progress_buffer,
+    job_store,
+)
+from ai_client import create_ai_client
+from zipwp_python_framework import GSWStudioPlatform, close_wp_connector
+
+
+async def generate_site_task(ctx, job_id: str, request_data: dict):
+    """Run one queued site generation job"""
+    await process_site_generation(
+        job_id,
+        SiteGenerationRequest(**request_data),
+        ctx["platform"]
+    )
+
+
+async def startup(ctx):
+    """Create one AI client and platform per worker process"""
+    ctx["ai_client"] = create_ai_client()
+    ctx["platform"] = GSWStudioPlatform(
+        ai_api_key=os.getenv("ANTHROPIC_API_KEY", "mock"),
+        ai_client=ctx["ai_client"]
+    )
+
+
+async def shutdown(ctx):
+    """Flush pending job updates and close connections"""
+    await progress_buffer.flush()
+    await job_store.close()
+    await ctx["ai_client"].aclose()
+    await close_wp_connector()
+
+
+class WorkerSettings:
+    """arq worker configuration"""
+    functions = [generate_site_task]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(os.getenv("REDIS_URL", "redis://localhost:6379"))
+    max_jobs = int(os.getenv("WORKER_MAX_JOBS", "10"))
+    # Site generation makes several AI calls; allow well beyond arq's 300s default
+    job_timeout = int(os.getenv("WORKER_JOB_TIMEOUT", "1800"))
@@ -3,22 +3,63 @@ gsWstudio.ai No-Code WordPress Platform - Python Implementation Framework
 Complete autonomous WordPress site generation system with 6 specialized agents
 """
 
-import json
+import os
+import re
+import sys
+import queue
+import atexit
+import time
+import random
 import asyncio
+import threading
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+import weakref
+import functools
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
+from string import Template
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, fields
 from datetime import datetime
 from enum import Enum
 import aiohttp
+import orjson
 import paramiko
 from abc import ABC, abstractmethod
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def configure_logging(level=logging.INFO):
+    """
+    Log through a queue so stream writes happen on a background thread
+    
+    Agents log from the event loop; the QueueHandler only enqueues records and
+    a QueueListener thread does the blocking writes. Like logging.basicConfig,
+    this leaves an already-configured root logger alone (apart from the level
+    when it was configured here).
+    """
+    root = logging.getLogger()
+    if any(isinstance(h, QueueHandler) for h in root.handlers):
+        root.setLevel(level)
+        return
+    if root.handlers:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -33,9 +74,14 @@ class Status(Enum):
     IN_PROGRESS = "in_progress"
 
 
-@dataclass
+# __slots__ dataclasses need Python 3.10+; older interpreters keep __dict__.
+# Code must not rely on vars()/__dict__ of these models.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AgentResponse:
-    """Standard response format for all agents"""
+    """Standard response format for all agents (immutable once built)"""
     status: str
     action: str
     result_summary: str
@@ -45,11 +91,35 @@ class AgentResponse:
     next_steps: List[str]
     required_credentials: Optional[List[str]] = None
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AgentResponse":
+        """Build from an agent result dict, ignoring any extra keys"""
+        return cls(
+            data["status"],
+            data["action"],
+            data["result_summary"],
+            data["result"],
+            data["assumptions"],
+            data["confidence"],
+            data["next_steps"],
+            data.get("required_credentials")
+        )
+    
     def to_dict(self) -> Dict:
-        return asdict(self)
+        """Shallow dict of the fields; nested values are shared, not copied"""
+        return {
+            "status": self.status,
+            "action": self.action,
+            "result_summary": self.result_summary,
+            "result": self.result,
+            "assumptions": self.assumptions,
+            "confidence": self.confidence,
+            "next_steps": self.next_steps,
+            "required_credentials": self.required_credentials
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BusinessInput:
     """User input for site generation"""
     business_name: str
@@ -62,9 +132,13 @@ class BusinessInput:
     design_preference: Optional[str] = "modern and clean"
     hosting_info: Optional[Dict[str, str]] = None
     domain: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """Shallow dict of the fields (works with or without __slots__)"""
+        return {field.name: getattr(self, field.name) for field in fields(self)}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class WordPressCredentials:
     """WordPress access credentials"""
     site_url: str
@@ -97,12 +171,20 @@ class Config:
     CONFIDENCE_CONTENT = 0.70
     CONFIDENCE_DESIGN = 0.60
     CONFIDENCE_OVERALL = 0.75
+    CONFIDENCE_ABORT = 0.30  # below this a pre-deployment step stops the workflow
     
     # API settings
     RETRY_ATTEMPTS = 2
     RETRY_DELAY = 5  # seconds
     BATCH_SIZE = 20  # items per API call
+    CONTENT_CONCURRENCY = 4  # page batches generated at once
+    MAX_PARALLEL_INSTALLS = 5  # plugin installs running on one WordPress host at once
+    INSTALL_TIMEOUT_S = 5  # seconds per plugin install/activate or content create call
+    AI_CONCURRENCY = int(os.getenv("ANTHROPIC_CONCURRENCY", "16"))  # AI calls in flight per process
     API_TIMEOUT = 30  # seconds
+    API_CONNECT_TIMEOUT = 5  # seconds to get a connection, so a dead host fails fast
+    CONNECTION_CHECK_TTL = 30  # seconds a successful WP connection test is reused
+    STEP_TIMEOUT = 300  # seconds each concurrent content/design/plugin step may take
     
     # WordPress defaults
     DEFAULT_PERMALINK_STRUCTURE = "/%postname%/"
@@ -120,6 +202,26 @@ class Config:
 # BASE AGENT CLASS
 # ============================================================================
 
+# {{variable}} placeholders in agent prompt templates
+PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# Shared by every agent and job so concurrent work can't flood the AI API.
+# A semaphore belongs to one event loop, so each running loop gets its own
+# (repeated asyncio.run calls, worker restarts).
+_ai_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _ai_semaphore() -> asyncio.Semaphore:
+    """The AI concurrency limit for the running event loop"""
+    loop = asyncio.get_running_loop()
+    semaphore = _ai_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _ai_semaphores[loop] = asyncio.Semaphore(Config.AI_CONCURRENCY)
+    return semaphore
+
+
 class BaseAgent(ABC):
     """Base class for all agents"""
     
@@ -131,7 +233,7 @@ class BaseAgent(ABC):
     def add_assumption(self, assumption: str):
         """Add an assumption to the log"""
         self.assumptions.append(f"ASSUME: {assumption}")
-        self.logger.info(f"Assumption: {assumption}")
+        self.logger.info("Assumption: %s", assumption)
     
     @abstractmethod
     async def execute(self, input_data: Dict) -> AgentResponse:
@@ -140,27 +242,29 @@ class BaseAgent(ABC):
     
     def build_prompt(self, template: str, variables: Dict) -> str:
         """Build prompt from template with variables"""
-        prompt = template
-        for key, value in variables.items():
-            placeholder = f"{{{{{key}}}}}"
-            prompt = prompt.replace(placeholder, str(value))
-        return prompt
+        # Single pass over the template; unknown {{placeholders}} are kept as-is
+        return PLACEHOLDER_RE.sub(
+            lambda match: str(variables[match.group(1)])
+            if match.group(1) in variables else match.group(0),
+            template
+        )
     
     async def call_ai_model(self, prompt: str, max_tokens: int) -> Dict:
         """Call AI model and return parsed JSON response"""
         try:
-            response = await self.ai_client.generate(
-                prompt=prompt,
-                temperature=Config.MODEL_TEMPERATURE,
-                top_p=Config.MODEL_TOP_P,
-                max_tokens=max_tokens
-            )
-            return json.loads(response)
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse AI response: {e}")
+            async with _ai_semaphore():
+                response = await self.ai_client.generate(
+                    prompt=prompt,
+                    temperature=Config.MODEL_TEMPERATURE,
+                    top_p=Config.MODEL_TOP_P,
+                    max_tokens=max_tokens
+                )
+            return orjson.loads(response)
+        except orjson.JSONDecodeError as e:
+            self.logger.error("Failed to parse AI response: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"AI model call failed: {e}")
+            self.logger.error("AI model call failed: %s", e)
             raise
 
 
@@ -171,6 +275,14 @@ class BaseAgent(ABC):
 class SitePlanningAgent(BaseAgent):
     """Generates WordPress site architecture"""
     
+    INDUSTRY_MAP = {
+        "restaurant": "food_service",
+        "dental": "healthcare",
+        "law": "legal",
+        "retail": "ecommerce",
+        "consulting": "professional_services"
+    }
+    
     PROMPT_TEMPLATE = """
 Task: Generate WordPress site architecture for business.
 
@@ -222,6 +334,11 @@ Output valid JSON only with this exact structure:
 Generate complete, valid JSON now.
 """
     
+    # Parsed once at class load: {{name}} placeholders become ${name}
+    PROMPT = Template(
+        PLACEHOLDER_RE.sub(r"${\1}", PROMPT_TEMPLATE.replace("$", "$$"))
+    )
+    
     async def execute(self, input_data: Dict) -> AgentResponse:
         """Generate site architecture"""
         self.logger.info("Starting site planning...")
@@ -241,31 +358,26 @@ Generate complete, valid JSON now.
             self.add_assumption("Using default goals: inform and generate leads")
         
         # Build and execute prompt
-        prompt = self.build_prompt(self.PROMPT_TEMPLATE, {
-            "business_name": business.business_name,
-            "business_type": business.business_type,
-            "industry": business.industry,
-            "description": business.description,
-            "target_audience": business.target_audience,
-            "goals": ", ".join(business.goals)
-        })
+        prompt = self.PROMPT.substitute(
+            business_name=business.business_name,
+            business_type=business.business_type,
+            industry=business.industry,
+            description=business.description,
+            target_audience=business.target_audience,
+            goals=", ".join(business.goals)
+        )
         
         result = await self.call_ai_model(prompt, Config.MAX_TOKENS_PLANNING)
         result["assumptions"].extend(self.assumptions)
         
-        self.logger.info(f"Site planning completed with confidence: {result['confidence']}")
-        return AgentResponse(**result)
-    
-    def _infer_industry(self, business_type: str) -> str:
-        """Infer industry from business type"""
-        industry_map = {
-            "restaurant": "food_service",
-            "dental": "healthcare",
-            "law": "legal",
-            "retail": "ecommerce",
-            "consulting": "professional_services"
-        }
-        return industry_map.get(business_type.lower(), "professional_services")
+        self.logger.info("Site planning completed with confidence: %s", result['confidence'])
+        return AgentResponse.from_dict(result)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _infer_industry(cls, business_type: str) -> str:
+        """Infer industry from business type (memoized per business type)"""
+        return cls.INDUSTRY_MAP.get(business_type.lower(), "professional_services")
 
 
 # ============================================================================
@@ -285,19 +397,13 @@ class ContentGenerationAgent(BaseAgent):
         
         pages_to_generate = site_structure.get("pages", [])
         
-        # Generate content in batches
-        all_pages = []
-        for i in range(0, len(pages_to_generate), 5):
-            batch = pages_to_generate[i:i+5]
-            batch_content = await self._generate_batch_content(
-                batch, business_context, tone
+        # Pages and blog posts are independent, so generate them concurrently
+        all_pages, posts = await asyncio.gather(
+            self._generate_pages(pages_to_generate, business_context, tone),
+            self._generate_initial_posts(
+                business_context, 
+                site_structure.get("content_strategy", {})
             )
-            all_pages.extend(batch_content)
-        
-        # Generate initial blog posts
-        posts = await self._generate_initial_posts(
-            business_context, 
-            site_structure.get("content_strategy", {})
         )
         
         result = {
@@ -313,7 +419,33 @@ class ContentGenerationAgent(BaseAgent):
             "next_steps": ["select_theme"]
         }
         
-        return AgentResponse(**result)
+        return AgentResponse.from_dict(result)
+    
+    async def _generate_pages(
+        self, pages: List[Dict], context: Dict, tone: str
+    ) -> List[Dict]:
+        """Generate content for all pages in concurrent batches"""
+        semaphore = asyncio.Semaphore(Config.CONTENT_CONCURRENCY)
+        
+        async def generate(batch):
+            async with semaphore:
+                return await self._generate_batch_content(batch, context, tone)
+        
+        batches = [pages[i:i+5] for i in range(0, len(pages), 5)]
+        results = await asyncio.gather(
+            *(generate(batch) for batch in batches), return_exceptions=True
+        )
+        
+        # A failed batch drops only its own pages, not the whole run
+        all_pages = []
+        for batch, batch_content in zip(batches, results):
+            if isinstance(batch_content, Exception):
+                self.add_assumption(
+                    f"Skipped {len(batch)} pages after generation failed: {batch_content}"
+                )
+            else:
+                all_pages.extend(batch_content)
+        return all_pages
     
     async def _generate_batch_content(
         self, pages: List[Dict], context: Dict, tone: str
@@ -321,9 +453,9 @@ class ContentGenerationAgent(BaseAgent):
         """Generate content for a batch of pages"""
         prompt = f"""
 Generate production-ready WordPress content for these pages:
-{json.dumps(pages, indent=2)}
+{orjson.dumps(pages).decode()}
 
-Business context: {json.dumps(context, indent=2)}
+Business context: {orjson.dumps(context).decode()}
 Tone: {tone}
 
 For each page, provide:
@@ -349,7 +481,7 @@ Output valid JSON array of page objects.
         prompt = f"""
 Generate 3 blog posts for:
 Business: {context.get('business_name')}
-Topics: {json.dumps(suggested_posts)}
+Topics: {orjson.dumps(suggested_posts).decode()}
 
 Each post: 500-800 words, SEO optimized.
 Output valid JSON array.
@@ -384,6 +516,8 @@ class ThemeDesignAgent(BaseAgent):
         }
     }
     
+    DEFAULT_THEME = THEME_DATABASE["professional_services"]
+    
     async def execute(self, input_data: Dict) -> AgentResponse:
         """Select theme and design configuration"""
         self.logger.info("Selecting theme and design...")
@@ -391,55 +525,126 @@ class ThemeDesignAgent(BaseAgent):
         industry = input_data.get("industry", "professional_services")
         business_type = input_data.get("business_type", "")
         
-        # Select theme based on industry
-        theme_config = self.THEME_DATABASE.get(
-            industry, 
-            self.THEME_DATABASE["professional_services"]
+        # Select theme based on industry; decoded per call so the result is
+        # this site's own copy
+        design = orjson.loads(self._build_design(industry))
+        
+        return AgentResponse(
+            status="ok",
+            action="theme_selected",
+            result_summary=f"Selected {design['primary_theme']['slug']} theme",
+            result=design,
+            assumptions=self.assumptions,
+            confidence=0.78,
+            next_steps=["select_plugins"]
         )
+    
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_design(cls, industry: str) -> bytes:
+        """Build the theme and design configuration for an industry, as JSON"""
+        theme_config = cls.THEME_DATABASE.get(industry, cls.DEFAULT_THEME)
         
-        result = {
-            "status": "ok",
-            "action": "theme_selected",
-            "result_summary": f"Selected {theme_config['theme']} theme",
-            "result": {
-                "primary_theme": {
-                    "name": theme_config["theme"].title(),
-                    "slug": theme_config["theme"],
-                    "version": "latest",
-                    "type": "free",
-                    "justification": f"Optimal for {industry} industry",
-                    "features": ["responsive", "seo-friendly", "fast-loading"],
-                    "performance_score": "excellent"
+        return orjson.dumps({
+            "primary_theme": {
+                "name": theme_config["theme"].title(),
+                "slug": theme_config["theme"],
+                "version": "latest",
+                "type": "free",
+                "justification": f"Optimal for {industry} industry",
+                "features": ["responsive", "seo-friendly", "fast-loading"],
+                "performance_score": "excellent"
+            },
+            "design_config": {
+                "color_palette": theme_config["colors"],
+                "typography": {
+                    "heading_font": "Montserrat",
+                    "body_font": "Open Sans",
+                    "base_size": "16px"
                 },
-                "design_config": {
-                    "color_palette": theme_config["colors"],
-                    "typography": {
-                        "heading_font": "Montserrat",
-                        "body_font": "Open Sans",
-                        "base_size": "16px"
-                    },
-                    "layout": {
-                        "container_width": "1200px",
-                        "sidebar": "none",
-                        "header_style": "modern"
-                    }
+                "layout": {
+                    "container_width": "1200px",
+                    "sidebar": "none",
+                    "header_style": "modern"
                 }
-            },
-            "assumptions": self.assumptions,
-            "confidence": 0.78,
-            "next_steps": ["select_plugins"]
-        }
-        
-        return AgentResponse(**result)
+            }
+        })
 
 
 # ============================================================================
 # AGENT 4: PLUGIN SELECTION & CONFIGURATION
 # ============================================================================
 
+# Words in lower-cased feature descriptions
+FEATURE_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
 class PluginSelectionAgent(BaseAgent):
     """Selects and configures WordPress plugins"""
     
+    # Whole words (after lowercasing and dropping hyphens) that mark an
+    # e-commerce site
+    ECOMMERCE_TOKENS = frozenset({"ecommerce", "woocommerce", "shop", "store"})
+    
+    # Plugin definitions; callers only ever get decoded copies (see below)
+    CORE_PLUGINS = [
+        {
+            "name": "Yoast SEO",
+            "slug": "wordpress-seo",
+            "purpose": "Search engine optimization",
+            "required": True,
+            "priority": 10,
+            "configuration": {"enable_xml_sitemap": True}
+        },
+        {
+            "name": "Wordfence Security",
+            "slug": "wordfence",
+            "purpose": "Site security and firewall",
+            "required": True,
+            "priority": 9,
+            "configuration": {"enable_firewall": True}
+        },
+        {
+            "name": "LiteSpeed Cache",
+            "slug": "litespeed-cache",
+            "purpose": "Performance optimization",
+            "required": True,
+            "priority": 8,
+            "configuration": {"enable_cache": True}
+        },
+        {
+            "name": "UpdraftPlus",
+            "slug": "updraftplus",
+            "purpose": "Backup and restore",
+            "required": True,
+            "priority": 7,
+            "configuration": {"backup_schedule": "daily"}
+        },
+        {
+            "name": "WPForms Lite",
+            "slug": "wpforms-lite",
+            "purpose": "Contact forms",
+            "required": True,
+            "priority": 6,
+            "configuration": {"enable_notification": True}
+        }
+    ]
+    ECOMMERCE_PLUGINS = CORE_PLUGINS + [
+        {
+            "name": "WooCommerce",
+            "slug": "woocommerce",
+            "purpose": "E-commerce functionality",
+            "required": False,
+            "priority": 5,
+            "configuration": {}
+        }
+    ]
+    
+    # Serialized once; each call decodes its own copy, so one site's result
+    # can't alter the plugin lists of the next
+    CORE_PLUGINS_JSON = orjson.dumps(CORE_PLUGINS)
+    ECOMMERCE_PLUGINS_JSON = orjson.dumps(ECOMMERCE_PLUGINS)
+    
     async def execute(self, input_data: Dict) -> AgentResponse:
         """Select essential plugins"""
         self.logger.info("Selecting plugins...")
@@ -447,60 +652,15 @@ class PluginSelectionAgent(BaseAgent):
         features = input_data.get("features", [])
         business_type = input_data.get("business_type", "")
         
-        # Core plugins (always included)
-        plugins = [
-            {
-                "name": "Yoast SEO",
-                "slug": "wordpress-seo",
-                "purpose": "Search engine optimization",
-                "required": True,
-                "priority": 10,
-                "configuration": {"enable_xml_sitemap": True}
-            },
-            {
-                "name": "Wordfence Security",
-                "slug": "wordfence",
-                "purpose": "Site security and firewall",
-                "required": True,
-                "priority": 9,
-                "configuration": {"enable_firewall": True}
-            },
-            {
-                "name": "LiteSpeed Cache",
-                "slug": "litespeed-cache",
-                "purpose": "Performance optimization",
-                "required": True,
-                "priority": 8,
-                "configuration": {"enable_cache": True}
-            },
-            {
-                "name": "UpdraftPlus",
-                "slug": "updraftplus",
-                "purpose": "Backup and restore",
-                "required": True,
-                "priority": 7,
-                "configuration": {"backup_schedule": "daily"}
-            },
-            {
-                "name": "WPForms Lite",
-                "slug": "wpforms-lite",
-                "purpose": "Contact forms",
-                "required": True,
-                "priority": 6,
-                "configuration": {"enable_notification": True}
-            }
-        ]
-        
-        # Add conditional plugins based on features
-        if any("ecommerce" in str(f).lower() for f in features):
-            plugins.append({
-                "name": "WooCommerce",
-                "slug": "woocommerce",
-                "purpose": "E-commerce functionality",
-                "required": False,
-                "priority": 5,
-                "configuration": {}
-            })
+        # Core plugins (always included), plus WooCommerce for e-commerce sites.
+        # All features are tokenized in one pass and checked by set membership;
+        # hyphens are dropped so "e-commerce" reads as "ecommerce".
+        feature_text = " ".join(map(str, features)).lower().replace("-", "")
+        feature_tokens = set(FEATURE_TOKEN_RE.findall(feature_text))
+        if not self.ECOMMERCE_TOKENS.isdisjoint(feature_tokens):
+            plugins = orjson.loads(self.ECOMMERCE_PLUGINS_JSON)
+        else:
+            plugins = orjson.loads(self.CORE_PLUGINS_JSON)
         
         result = {
             "status": "ok",
@@ -516,7 +676,7 @@ class PluginSelectionAgent(BaseAgent):
             "next_steps": ["deploy_site"]
         }
         
-        return AgentResponse(**result)
+        return AgentResponse.from_dict(result)
 
 
 # ============================================================================
@@ -526,10 +686,24 @@ class PluginSelectionAgent(BaseAgent):
 class DeploymentAgent(BaseAgent):
     """Orchestrates WordPress deployment"""
     
+    # Returned as-is whenever credentials are missing; treat as read-only
+    NEEDS_CREDENTIALS = AgentResponse(
+        status="needs_input",
+        action="deployment_blocked",
+        result_summary="WordPress credentials required",
+        result={},
+        assumptions=[],
+        confidence=0.0,
+        next_steps=["provide_credentials"],
+        required_credentials=["wp_url", "wp_user", "wp_password"]
+    )
+    
     def __init__(self, ai_client, wp_api_client, ssh_client):
         super().__init__(ai_client)
         self.wp_api = wp_api_client
         self.ssh = ssh_client
+        self._connection_ok: Optional[bool] = None
+        self._connection_checked_at = 0.0
     
     async def execute(self, input_data: Dict) -> AgentResponse:
         """Execute WordPress deployment"""
@@ -537,16 +711,7 @@ class DeploymentAgent(BaseAgent):
         
         credentials = input_data.get("credentials")
         if not credentials:
-            return AgentResponse(
-                status="needs_input",
-                action="deployment_blocked",
-                result_summary="WordPress credentials required",
-                result={},
-                assumptions=[],
-                confidence=0.0,
-                next_steps=["provide_credentials"],
-                required_credentials=["wp_url", "wp_user", "wp_password"]
-            )
+            return self.NEEDS_CREDENTIALS
         
         deployment_steps = []
         
@@ -564,6 +729,7 @@ class DeploymentAgent(BaseAgent):
             plugins = input_data.get("plugins", [])
             step = await self._install_plugins(plugins)
             deployment_steps.append(step)
+            installed_plugins = step["installed"]
             
             # Step 4: Import content (pages and posts)
             content = input_data.get("content", {})
@@ -580,7 +746,7 @@ class DeploymentAgent(BaseAgent):
             deployment_steps.append(step)
             
             # Step 7: Run health checks
-            health = await self._run_health_checks()
+            health = await self._run_health_checks(theme.get("slug"), installed_plugins)
             deployment_steps.append(health)
             
             site_url = credentials.get("site_url")
@@ -611,7 +777,7 @@ class DeploymentAgent(BaseAgent):
             }
             
         except Exception as e:
-            self.logger.error(f"Deployment failed: {e}")
+            self.logger.error("Deployment failed: %s", e)
             result = {
                 "status": "failed",
                 "action": "deployment_failed",
@@ -622,14 +788,23 @@ class DeploymentAgent(BaseAgent):
                 "next_steps": ["review_error", "retry_deployment"]
             }
         
-        return AgentResponse(**result)
+        return AgentResponse.from_dict(result)
+    
+    async def _test_connection(self, max_age: float = Config.CONNECTION_CHECK_TTL) -> bool:
+        """Test the WP connection, reusing a successful result up to max_age seconds old"""
+        now = time.monotonic()
+        if self._connection_ok and now - self._connection_checked_at < max_age:
+            return True
+        self._connection_ok = await self.wp_api.test_connection()
+        self._connection_checked_at = now
+        return self._connection_ok
     
     async def _validate_wordpress(self, credentials: Dict) -> Dict:
         """Validate WordPress installation"""
         self.logger.info("Validating WordPress...")
         try:
             # Test WP REST API connection
-            await self.wp_api.test_connection()
+            await self._test_connection(max_age=0)
             return {
                 "step": "validate_wordpress",
                 "status": "completed",
@@ -646,7 +821,7 @@ class DeploymentAgent(BaseAgent):
     
     async def _install_theme(self, theme: Dict) -> Dict:
         """Install and activate theme"""
-        self.logger.info(f"Installing theme: {theme.get('slug')}")
+        self.logger.info("Installing theme: %s", theme.get('slug'))
         try:
             await self.wp_api.install_theme(theme.get("slug"))
             await self.wp_api.activate_theme(theme.get("slug"))
@@ -666,17 +841,38 @@ class DeploymentAgent(BaseAgent):
     
     async def _install_plugins(self, plugins: List[Dict]) -> Dict:
         """Install and activate plugins"""
-        self.logger.info(f"Installing {len(plugins)} plugins...")
-        installed = []
-        failed = []
+        self.logger.info("Installing %s plugins...", len(plugins))
         
-        for plugin in plugins:
-            try:
-                await self.wp_api.install_plugin(plugin["slug"])
-                await self.wp_api.activate_plugin(plugin["slug"])
-                installed.append(plugin["slug"])
-            except Exception as e:
-                failed.append({"slug": plugin["slug"], "error": str(e)})
+        semaphore = asyncio.Semaphore(Config.MAX_PARALLEL_INSTALLS)
+        
+        async def install_one(plugin):
+            slug = plugin["slug"]
+            async with semaphore:
+                # A hung call is abandoned, so it can't hold a slot (and the
+                # whole step) open indefinitely
+                try:
+                    await self._install_plugin_watched(slug)
+                    # Activation is idempotent, so a hung call is just re-sent
+                    for attempt in range(2):
+                        try:
+                            await asyncio.wait_for(
+                                self.wp_api.activate_plugin(slug), Config.INSTALL_TIMEOUT_S
+                            )
+                            return slug, None
+                        except asyncio.TimeoutError:
+                            self.logger.warning("Activating plugin %s timed out (attempt %s)", slug, attempt + 1)
+                    raise TimeoutError(f"activation timed out after {Config.INSTALL_TIMEOUT_S}s")
+                except Exception as e:
+                    return slug, e
+        
+        # Plugins are independent, so install them concurrently, capped so a
+        # long plugin list doesn't overload the WordPress host
+        results = await asyncio.gather(*(install_one(plugin) for plugin in plugins))
+        installed = [slug for slug, error in results if error is None]
+        failed = [
+            {"slug": slug, "error": str(error)}
+            for slug, error in results if error is not None
+        ]
         
         return {
             "step": "install_plugins",
@@ -687,34 +883,102 @@ class DeploymentAgent(BaseAgent):
             "duration": "15s"
         }
     
+    async def _install_plugin_watched(self, slug: str) -> None:
+        """
+        Install a plugin, re-sending the request once if it hangs
+        
+        A timed-out install may still finish on the server, so it is only
+        re-sent once the site confirms the plugin is missing; re-sending
+        blindly could install it twice and exceed MAX_PARALLEL_INSTALLS.
+        
+        Raises:
+            TimeoutError: If the install hangs and can't safely be retried
+        """
+        for attempt in range(2):
+            try:
+                await asyncio.wait_for(self.wp_api.install_plugin(slug), Config.INSTALL_TIMEOUT_S)
+                return
+            except asyncio.TimeoutError:
+                self.logger.warning("Installing plugin %s timed out (attempt %s)", slug, attempt + 1)
+            installed = await self._plugin_installed(slug)
+            if installed:
+                return
+            if installed is None:
+                break  # It may still be installing; don't send it twice
+        raise TimeoutError(f"install timed out after {Config.INSTALL_TIMEOUT_S}s")
+    
+    async def _plugin_installed(self, slug: str) -> Optional[bool]:
+        """Whether the site has the plugin installed, or None if it can't say"""
+        check = getattr(self.wp_api, "is_plugin_installed", None)
+        if check is None:
+            return None
+        try:
+            return await asyncio.wait_for(check(slug), Config.INSTALL_TIMEOUT_S)
+        except Exception as e:
+            self.logger.warning("Could not check whether plugin %s is installed: %s", slug, e)
+            return None
+    
     async def _import_content(self, content: Dict) -> Dict:
         """Import pages and posts"""
         self.logger.info("Importing content...")
         pages = content.get("pages", [])
         posts = content.get("posts", [])
+        created = {"page": 0, "post": 0}
+        logger = self.logger
         
-        created_pages = 0
-        created_posts = 0
+        # Batch endpoint first: a handful of requests instead of one per item.
+        # Rejected items, or everything if batching is unavailable, fall
+        # through to individual creates below.
+        if hasattr(self.wp_api, "create_batch") and (pages or posts):
+            # Both batches run to completion before anything falls back, and
+            # only the kind whose batch failed is retried item by item
+            # (items that batch did create are not sent again).
+            batched = await asyncio.gather(
+                asyncio.wait_for(self.wp_api.create_batch("pages", pages), Config.API_TIMEOUT),
+                asyncio.wait_for(self.wp_api.create_batch("posts", posts), Config.API_TIMEOUT),
+                return_exceptions=True
+            )
+            remaining = []
+            for kind, items, objs in zip(("page", "post"), (pages, posts), batched):
+                if isinstance(objs, asyncio.TimeoutError):
+                    # Abandoned requests may still land, so don't re-send them
+                    logger.error("Batch %s import timed out after %ss", kind, Config.API_TIMEOUT)
+                    remaining.append([])
+                elif isinstance(objs, Exception):
+                    logger.warning("Batch %s import failed, creating them one by one: %s", kind, objs)
+                    remaining.append(items)
+                else:
+                    remaining.append([item for item, obj in zip(items, objs) if obj is None])
+                    created[kind] = sum(obj is not None for obj in objs)
+            pages, posts = remaining
         
-        # Import pages in batches
-        for i in range(0, len(pages), Config.BATCH_SIZE):
-            batch = pages[i:i+Config.BATCH_SIZE]
-            for page in batch:
-                try:
-                    await self.wp_api.create_page(page)
-                    created_pages += 1
-                except Exception as e:
-                    self.logger.error(f"Failed to create page: {e}")
+        # A pool of BATCH_SIZE workers drains one shared queue, so a slow request
+        # holds up only its own worker. Pages are queued ahead of posts. A hung
+        # create is abandoned after INSTALL_TIMEOUT_S and not re-sent, since it
+        # may still land on the server.
+        work = asyncio.Queue()
+        for page in pages:
+            work.put_nowait((self.wp_api.create_page, "page", page))
+        for post in posts:
+            work.put_nowait((self.wp_api.create_post, "post", post))
         
-        # Import posts in batches
-        for i in range(0, len(posts), Config.BATCH_SIZE):
-            batch = posts[i:i+Config.BATCH_SIZE]
-            for post in batch:
+        async def worker():
+            while True:
+                try:
+                    create, kind, item = work.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
                 try:
-                    await self.wp_api.create_post(post)
-                    created_posts += 1
+                    await asyncio.wait_for(create(item), Config.INSTALL_TIMEOUT_S)
+                    created[kind] += 1
+                except asyncio.TimeoutError:
+                    logger.error("Creating %s timed out after %ss", kind, Config.INSTALL_TIMEOUT_S)
                 except Exception as e:
-                    self.logger.error(f"Failed to create post: {e}")
+                    logger.error("Failed to create %s: %s", kind, e)
+        
+        await asyncio.gather(*(worker() for _ in range(min(Config.BATCH_SIZE, work.qsize()))))
+        created_pages = created["page"]
+        created_posts = created["post"]
         
         return {
             "step": "import_content",
@@ -727,8 +991,13 @@ class DeploymentAgent(BaseAgent):
         """Configure WordPress menus"""
         self.logger.info("Configuring menus...")
         try:
-            for menu in menus:
-                await self.wp_api.create_menu(menu)
+            results = await asyncio.gather(
+                *(self.wp_api.create_menu(menu) for menu in menus),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
             return {
                 "step": "configure_menus",
                 "status": "completed",
@@ -762,15 +1031,44 @@ class DeploymentAgent(BaseAgent):
                 "duration": "2s"
             }
     
-    async def _run_health_checks(self) -> Dict:
-        """Run post-deployment health checks"""
+    async def _run_health_checks(self, theme_slug: Optional[str] = None,
+                                 plugin_slugs: Optional[List[str]] = None) -> Dict:
+        """
+        Run post-deployment health checks
+        
+        Args:
+            theme_slug: Theme that should be active
+            plugin_slugs: Plugins that should be active
+        """
         self.logger.info("Running health checks...")
+        
+        async def probe(name: str):
+            # Looked up inside the coroutine, so a client without the probe
+            # fails that one check rather than the whole step
+            return await getattr(self.wp_api, name)()
+        
+        # Independent probes: total time is the slowest one, not the sum
+        results = await asyncio.gather(
+            self._test_connection(),
+            probe("check_https"),
+            probe("get_active_theme"),
+            probe("list_active_plugins"),
+            probe("count_pages"),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.warning("Health check failed: %r", result)
+        results = [None if isinstance(result, Exception) else result for result in results]
+        accessible, ssl_active, active_theme, active_plugins, pages_created = results
+        
         checks = {
-            "site_accessible": await self.wp_api.test_connection(),
-            "ssl_active": False,  # Would check HTTPS
-            "theme_active": True,
-            "plugins_active": [],
-            "pages_created": 0,
+            "site_accessible": bool(accessible),
+            "ssl_active": bool(ssl_active),
+            "theme_active": active_theme is not None and theme_slug in (None, active_theme),
+            "plugins_active": active_plugins is not None
+                              and set(plugin_slugs or ()) <= set(active_plugins),
+            "pages_created": pages_created or 0,
             "performance_score": "good"
         }
         return {
@@ -785,6 +1083,10 @@ class DeploymentAgent(BaseAgent):
 # AGENT 6: MASTER ORCHESTRATOR
 # ============================================================================
 
+# BusinessInput fields passed to content generation as business context
+CONTEXT_FIELDS = ("business_name", "business_type", "industry")
+
+
 class MasterOrchestrator:
     """Coordinates all agents and manages workflow"""
     
@@ -799,54 +1101,86 @@ class MasterOrchestrator:
         self.logger = logging.getLogger("MasterOrchestrator")
         self.workflow_state = {}
     
+    async def _with_timeout(self, step: str, coro):
+        """Await a workflow step, failing it after Config.STEP_TIMEOUT seconds"""
+        try:
+            return await asyncio.wait_for(coro, Config.STEP_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"{step} step timed out after {Config.STEP_TIMEOUT}s") from None
+    
+    def _step_confidence(self, step: str, response: AgentResponse, warn_below: float) -> float:
+        """Return a step's confidence, stopping the workflow if it is critically low"""
+        if response.confidence < Config.CONFIDENCE_ABORT:
+            raise Exception(
+                f"{step} confidence {response.confidence} is below "
+                f"{Config.CONFIDENCE_ABORT}; skipping remaining steps"
+            )
+        if response.confidence < warn_below:
+            self.logger.warning("Low confidence in %s: %s", step, response.confidence)
+        return response.confidence
+    
     async def generate_site(self, business_input: BusinessInput) -> Dict:
         """Main workflow: orchestrate all agents to generate complete site"""
-        self.logger.info(f"Starting site generation for {business_input.business_name}")
+        self.logger.info("Starting site generation for %s", business_input.business_name)
         
         start_time = datetime.now()
         results = {}
+        confidence_total = 0.0
         
         try:
             # Step 1: Site Planning
             self.logger.info("Step 1/5: Site Planning")
-            planning_result = await self.planning_agent.execute(asdict(business_input))
-            results["architecture"] = planning_result.result
-            
-            if planning_result.confidence < Config.CONFIDENCE_OVERALL:
-                self.logger.warning(f"Low confidence in planning: {planning_result.confidence}")
+            # Shallow copy, taken once: the planner builds its own BusinessInput
+            # and only reassigns fields, so nested values needn't be deep-copied
+            business = business_input.to_dict()
+            planning_result = await self.planning_agent.execute(business)
+            plan = results["architecture"] = planning_result.result
+            confidence_total += self._step_confidence(
+                "planning", planning_result, Config.CONFIDENCE_OVERALL
+            )
             
-            # Step 2: Content Generation
-            self.logger.info("Step 2/5: Content Generation")
+            # Steps 2-4 depend only on the plan, so run them concurrently
+            self.logger.info("Steps 2-4/5: Content Generation, Theme Selection, Plugin Selection")
+            # Looked up once and shared by every later step
+            site_structure = plan.get("site_structure") or {}
             content_input = {
-                "site_structure": planning_result.result.get("site_structure"),
-                "business_context": {
-                    "business_name": business_input.business_name,
-                    "business_type": business_input.business_type,
-                    "industry": business_input.industry
-                },
-                "tone": business_input.tone
+                "site_structure": site_structure,
+                "business_context": {field: business[field] for field in CONTEXT_FIELDS},
+                "tone": business["tone"]
             }
-            content_result = await self.content_agent.execute(content_input)
-            results["content"] = content_result.result
-            
-            # Step 3: Theme & Design
-            self.logger.info("Step 3/5: Theme Selection")
             design_input = {
-                "industry": business_input.industry,
-                "business_type": business_input.business_type,
-                "site_structure": planning_result.result.get("site_structure")
+                "industry": business["industry"],
+                "business_type": business["business_type"],
+                "site_structure": site_structure
             }
-            design_result = await self.design_agent.execute(design_input)
-            results["design"] = design_result.result
-            
-            # Step 4: Plugin Selection
-            self.logger.info("Step 4/5: Plugin Selection")
             plugin_input = {
-                "features": planning_result.result.get("features", []),
-                "business_type": business_input.business_type
+                "features": plan.get("features", []),
+                "business_type": business["business_type"]
             }
-            plugin_result = await self.plugin_agent.execute(plugin_input)
-            results["plugins"] = plugin_result.result
+            branch_results = await asyncio.gather(
+                self._with_timeout("content", self.content_agent.execute(content_input)),
+                self._with_timeout("design", self.design_agent.execute(design_input)),
+                self._with_timeout("plugins", self.plugin_agent.execute(plugin_input)),
+                return_exceptions=True
+            )
+            
+            # Keep whatever succeeded, then fail on the first error
+            for step, branch_result in zip(("content", "design", "plugins"), branch_results):
+                if not isinstance(branch_result, BaseException):
+                    results[step] = branch_result.result
+            for branch_result in branch_results:
+                if isinstance(branch_result, BaseException):
+                    raise branch_result
+            content_result, design_result, plugin_result = branch_results
+            confidence_total += self._step_confidence(
+                "content", content_result, Config.CONFIDENCE_CONTENT
+            )
+            confidence_total += self._step_confidence(
+                "design", design_result, Config.CONFIDENCE_DESIGN
+            )
+            confidence_total += self._step_confidence(
+                "plugins", plugin_result, Config.CONFIDENCE_OVERALL
+            )
             
             # Step 5: Deployment
             self.logger.info("Step 5/5: Deployment")
@@ -855,7 +1189,7 @@ class MasterOrchestrator:
                 "theme": design_result.result.get("primary_theme"),
                 "plugins": plugin_result.result.get("essential_plugins"),
                 "content": content_result.result,
-                "menus": planning_result.result.get("site_structure", {}).get("menus", [])
+                "menus": site_structure.get("menus", [])
             }
             deployment_result = await self.deployment_agent.execute(deployment_input)
             results["deployment"] = deployment_result.result
@@ -865,13 +1199,8 @@ class MasterOrchestrator:
             duration = (end_time - start_time).total_seconds()
             
             # Compile final response
-            overall_confidence = sum([
-                planning_result.confidence,
-                content_result.confidence,
-                design_result.confidence,
-                plugin_result.confidence,
-                deployment_result.confidence
-            ]) / 5
+            confidence_total += deployment_result.confidence
+            overall_confidence = confidence_total / 5
             
             final_result = {
                 "workflow_status": "completed",
@@ -899,11 +1228,11 @@ class MasterOrchestrator:
                 "execution_time": f"{duration:.1f} seconds"
             }
             
-            self.logger.info(f"Site generation completed in {duration:.1f}s")
+            self.logger.info("Site generation completed in %.1fs", duration)
             return final_result
             
         except Exception as e:
-            self.logger.error(f"Site generation failed: {e}")
+            self.logger.error("Site generation failed: %s", e)
             return {
                 "workflow_status": "failed",
                 "error": str(e),
@@ -921,112 +1250,323 @@ class MasterOrchestrator:
 # WORDPRESS API CLIENT
 # ============================================================================
 
+# One keep-alive connection pool shared by every WordPressAPIClient, so
+# successive requests and deployments skip the TCP/TLS handshake
+_wp_connector: Optional[aiohttp.TCPConnector] = None
+
+
+def get_wp_connector() -> aiohttp.TCPConnector:
+    """Return the shared WordPress connection pool (created on first use)"""
+    global _wp_connector
+    if _wp_connector is None or _wp_connector.closed:
+        _wp_connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=16,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+    return _wp_connector
+
+
+async def close_wp_connector():
+    """Close the shared WordPress connection pool"""
+    global _wp_connector
+    if _wp_connector is not None:
+        await _wp_connector.close()
+        _wp_connector = None
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Rate limiting and server-side failures that are worth retrying
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
 class WordPressAPIClient:
     """Client for WordPress REST API interactions"""
     
+    # Sub-requests per /batch/v1 call (WordPress rejects more than 25 by default)
+    BATCH_LIMIT = 25
+    
     def __init__(self, credentials: WordPressCredentials):
         self.credentials = credentials
         self.base_url = f"{credentials.site_url}/wp-json/wp/v2"
+        self.batch_url = f"{credentials.site_url}/wp-json/batch/v1"
         self.auth = aiohttp.BasicAuth(
             credentials.username, 
             credentials.password
         )
         self.session = None
         self.logger = logging.getLogger("WordPressAPI")
+        # Created pages/posts/menus by payload hash, so retried or repeated
+        # imports don't create duplicates
+        self._created: Dict[str, Dict] = {}
+        # Themes/plugins already installed through this client, as (kind, slug)
+        self._installed: set = set()
+        # Last ETag-tagged GET response per (url, params): (etag, body, headers)
+        self._etags: Dict[Tuple, Tuple[str, Any, Any]] = {}
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            auth=self.auth,
-            timeout=aiohttp.ClientTimeout(total=Config.API_TIMEOUT)
-        )
+        self._get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    @staticmethod
+    def _content_key(endpoint: str, body: bytes) -> str:
+        return hashlib.blake2b(endpoint.encode() + b"|" + body, digest_size=16).hexdigest()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return this client's session on the shared connection pool"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                auth=self.auth,
+                timeout=aiohttp.ClientTimeout(
+                    total=Config.API_TIMEOUT, connect=Config.API_CONNECT_TIMEOUT
+                ),
+                connector=get_wp_connector(),
+                connector_owner=False
+            )
+        return self.session
+    
+    async def close(self):
+        """Close the session; pooled connections stay open for reuse"""
         if self.session:
             await self.session.close()
+            self.session = None
+    
+    async def _get_json(self, path: str, params: Optional[Dict[str, str]] = None) -> Tuple[Any, Any]:
+        """
+        GET a REST path, revalidating with If-None-Match once an ETag is known
+        
+        A 304 reuses the stored body without downloading or parsing it again.
+        Cached bodies are shared between calls; treat them as read-only.
+        
+        Returns:
+            (parsed body, response headers)
+        """
+        url = f"{self.base_url}/{path}"
+        key = (url, tuple(sorted((params or {}).items())))
+        cached = self._etags.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        async with self._get_session().get(url, params=params, headers=headers) as resp:
+            if resp.status == 304 and cached:
+                return cached[1], cached[2]
+            resp.raise_for_status()
+            body = await resp.json()
+            etag = resp.headers.get("ETag")
+            if etag:
+                self._etags[key] = (etag, body, resp.headers.copy())
+            return body, resp.headers
     
     async def test_connection(self) -> bool:
         """Test WordPress API connection"""
         try:
-            async with self.session.get(f"{self.base_url}/posts") as resp:
-                return resp.status == 200
+            await self._get_json("posts", {"per_page": "1", "_fields": "id"})
+            return True
         except Exception as e:
-            self.logger.error(f"Connection test failed: {e}")
+            self.logger.error("Connection test failed: %s", e)
             return False
     
-    async def create_page(self, page_data: Dict) -> Dict:
-        """Create a WordPress page"""
-        payload = {
+    async def check_https(self) -> bool:
+        """Check that the site answers over HTTPS"""
+        host = self.credentials.site_url.split("://", 1)[-1]
+        try:
+            async with self._get_session().head(f"https://{host}/wp-json/") as resp:
+                return resp.status < 400
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+    
+    async def list_active_plugins(self) -> List[str]:
+        """Slugs of active plugins (needs WordPress 5.5+ and plugin permissions)"""
+        plugins, _ = await self._get_json("plugins", {"status": "active"})
+        # "plugin" is "<slug>/<main file>"
+        return [plugin["plugin"].split("/", 1)[0] for plugin in plugins]
+    
+    async def count_pages(self) -> int:
+        """Number of pages on the site, from the X-WP-Total header"""
+        _, headers = await self._get_json("pages", {"per_page": "1", "_fields": "id"})
+        return int(headers.get("X-WP-Total", 0))
+    
+    @staticmethod
+    def _page_payload(page_data: Dict) -> Dict:
+        seo = page_data.get("seo") or {}
+        return {
             "title": page_data.get("title"),
             "content": page_data.get("content_html"),
-            "slug": page_data.get("seo", {}).get("slug"),
+            "slug": seo.get("slug"),
             "status": "publish",
-            "meta": {
-                "description": page_data.get("seo", {}).get("meta_description")
-            }
+            "meta": {"description": seo.get("meta_description")}
         }
+    
+    @staticmethod
+    def _post_payload(post_data: Dict) -> Dict:
+        return {
+            "title": post_data.get("title"),
+            "content": post_data.get("content_html"),
+            "excerpt": post_data.get("excerpt"),
+            "status": "publish",
+            "categories": post_data.get("categories", []),
+            "tags": post_data.get("tags", [])
+        }
+    
+    async def create_page(self, page_data: Dict) -> Dict:
+        """Create a WordPress page"""
+        # Serialized once, not on every retry
+        body = orjson.dumps(self._page_payload(page_data))
+        key = self._content_key("pages", body)
+        if key in self._created:
+            return self._created[key]
         
         for attempt in range(Config.RETRY_ATTEMPTS):
+            # Exponential backoff with jitter so concurrent retries spread out
+            delay = Config.RETRY_DELAY * (2 ** attempt) + random.uniform(0, 0.25)
             try:
-                async with self.session.post(
+                async with self._get_session().post(
                     f"{self.base_url}/pages", 
-                    json=payload
+                    data=body,
+                    headers=JSON_HEADERS
                 ) as resp:
                     if resp.status in [200, 201]:
-                        return await resp.json()
-                    self.logger.warning(f"Create page failed: {resp.status}")
-            except Exception as e:
-                self.logger.error(f"Create page error (attempt {attempt+1}): {e}")
-                if attempt < Config.RETRY_ATTEMPTS - 1:
-                    await asyncio.sleep(Config.RETRY_DELAY)
+                        created = self._created[key] = await resp.json()
+                        return created
+                    self.logger.warning("Create page failed: %s", resp.status)
+                    if resp.status not in RETRYABLE_STATUSES:
+                        break  # Permanent error, retrying won't help
+                    retry_after = resp.headers.get("Retry-After", "")
+                    if resp.status == 429 and retry_after.isdigit():
+                        delay = float(retry_after)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.error("Create page error (attempt %s): %s", attempt+1, e)
+            
+            if attempt < Config.RETRY_ATTEMPTS - 1:
+                await asyncio.sleep(delay)
         
         raise Exception(f"Failed to create page: {page_data.get('title')}")
     
     async def create_post(self, post_data: Dict) -> Dict:
         """Create a WordPress post"""
-        payload = {
-            "title": post_data.get("title"),
-            "content": post_data.get("content_html"),
-            "excerpt": post_data.get("excerpt"),
-            "status": "publish",
-            "categories": post_data.get("categories", []),
-            "tags": post_data.get("tags", [])
-        }
+        body = orjson.dumps(self._post_payload(post_data))
+        key = self._content_key("posts", body)
+        if key in self._created:
+            return self._created[key]
         
-        async with self.session.post(f"{self.base_url}/posts", json=payload) as resp:
+        async with self._get_session().post(
+            f"{self.base_url}/posts",
+            data=body,
+            headers=JSON_HEADERS
+        ) as resp:
             if resp.status in [200, 201]:
-                return await resp.json()
+                created = self._created[key] = await resp.json()
+                return created
             raise Exception(f"Failed to create post: {resp.status}")
     
+    async def create_batch(self, kind: str, items: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Create pages or posts through the REST batch endpoint (WordPress 5.6+)
+        
+        Sends up to BATCH_LIMIT items per request, with the requests in flight
+        concurrently. Items this client already created are not sent again.
+        
+        Args:
+            kind: "pages" or "posts"
+            items: Page or post data, as for create_page/create_post
+            
+        Returns:
+            The created objects in item order; None for items WordPress rejected
+        
+        Raises:
+            Exception: If a batch request as a whole fails
+        """
+        build = self._page_payload if kind == "pages" else self._post_payload
+        payloads = [build(item) for item in items]
+        keys = [self._content_key(kind, orjson.dumps(payload)) for payload in payloads]
+        results = [self._created.get(key) for key in keys]
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        chunks = [
+            pending[i:i + self.BATCH_LIMIT]
+            for i in range(0, len(pending), self.BATCH_LIMIT)
+        ]
+        
+        async def send(chunk: List[int]) -> None:
+            body = orjson.dumps({"requests": [
+                {"method": "POST", "path": f"/wp/v2/{kind}", "body": payloads[i]}
+                for i in chunk
+            ]})
+            async with self._get_session().post(
+                self.batch_url, data=body, headers=JSON_HEADERS
+            ) as resp:
+                if resp.status not in [200, 207]:
+                    raise Exception(f"Batch create {kind} failed: {resp.status}")
+                responses = (await resp.json()).get("responses", [])
+            for i, response in zip(chunk, responses):
+                if 200 <= response.get("status", 0) < 300:
+                    results[i] = self._created[keys[i]] = response.get("body")
+        
+        # Let every chunk finish before raising, so a caller falling back to
+        # create_page/create_post never races requests still in flight
+        errors = await asyncio.gather(*(send(chunk) for chunk in chunks), return_exceptions=True)
+        for error in errors:
+            if isinstance(error, BaseException):
+                raise error
+        return results
+    
     async def install_theme(self, theme_slug: str) -> bool:
         """Install theme via WP-CLI or plugin"""
+        if ("theme", theme_slug) in self._installed:
+            return True
         # This would require WP-CLI access via SSH
-        self.logger.info(f"Installing theme: {theme_slug}")
+        self.logger.info("Installing theme: %s", theme_slug)
+        self._installed.add(("theme", theme_slug))
         return True
     
+    async def get_active_theme(self) -> Optional[str]:
+        """Stylesheet slug of the active theme, or None if none is reported"""
+        themes, _ = await self._get_json("themes", {"status": "active", "_fields": "stylesheet"})
+        return themes[0]["stylesheet"] if themes else None
+    
     async def activate_theme(self, theme_slug: str) -> bool:
         """Activate theme"""
-        self.logger.info(f"Activating theme: {theme_slug}")
+        self.logger.info("Activating theme: %s", theme_slug)
         return True
     
     async def install_plugin(self, plugin_slug: str) -> bool:
         """Install plugin via WP-CLI"""
-        self.logger.info(f"Installing plugin: {plugin_slug}")
+        if ("plugin", plugin_slug) in self._installed:
+            return True
+        self.logger.info("Installing plugin: %s", plugin_slug)
+        self._installed.add(("plugin", plugin_slug))
         return True
     
+    async def is_plugin_installed(self, plugin_slug: str) -> bool:
+        """Whether the plugin is installed, active or not (WordPress 5.5+)"""
+        if ("plugin", plugin_slug) in self._installed:
+            return True
+        plugins, _ = await self._get_json("plugins", {"search": plugin_slug, "_fields": "plugin"})
+        # "plugin" is "<slug>/<main file>"
+        return any(plugin["plugin"].split("/", 1)[0] == plugin_slug for plugin in plugins)
+    
     async def activate_plugin(self, plugin_slug: str) -> bool:
         """Activate plugin"""
-        self.logger.info(f"Activating plugin: {plugin_slug}")
+        self.logger.info("Activating plugin: %s", plugin_slug)
         return True
     
     async def create_menu(self, menu_data: Dict) -> Dict:
         """Create navigation menu"""
-        self.logger.info(f"Creating menu: {menu_data.get('name')}")
-        return {"id": 1, "name": menu_data.get("name")}
+        key = self._content_key("menus", orjson.dumps(menu_data, option=orjson.OPT_SORT_KEYS))
+        if key in self._created:
+            return self._created[key]
+        self.logger.info("Creating menu: %s", menu_data.get('name'))
+        created = self._created[key] = {"id": 1, "name": menu_data.get("name")}
+        return created
     
     async def set_option(self, option_name: str, option_value: str) -> bool:
         """Set WordPress option"""
-        self.logger.info(f"Setting option: {option_name} = {option_value}")
+        self.logger.info("Setting option: %s = %s", option_name, option_value)
         return True
 
 
@@ -1037,10 +1577,23 @@ class WordPressAPIClient:
 class SSHClient:
     """SSH client for WP-CLI operations"""
     
+    # Blocking paramiko calls per client that may run in worker threads at once
+    MAX_THREADS = 4
+    
     def __init__(self, credentials: WordPressCredentials):
         self.credentials = credentials
         self.client = None
         self.logger = logging.getLogger("SSHClient")
+        self._connect_lock = threading.Lock()
+        self._executor = None
+    
+    async def _run_blocking(self, func, *args):
+        """Run a blocking paramiko call in this client's thread pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_THREADS, thread_name_prefix="ssh"
+            )
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
     
     def connect(self):
         """Establish SSH connection"""
@@ -1056,29 +1609,56 @@ class SSHClient:
                 self.client.connect(
                     self.credentials.ssh_host,
                     username=self.credentials.ssh_user,
-                    pkey=key
+                    pkey=key,
+                    compress=True
                 )
             else:
                 self.client.connect(
                     self.credentials.ssh_host,
                     username=self.credentials.ssh_user,
-                    password=self.credentials.ssh_password
+                    password=self.credentials.ssh_password,
+                    compress=True
                 )
+            # Keep the session alive between commands so every WP-CLI call
+            # runs over this one transport
+            self.client.get_transport().set_keepalive(30)
             self.logger.info("SSH connection established")
         except Exception as e:
-            self.logger.error(f"SSH connection failed: {e}")
+            self.logger.error("SSH connection failed: %s", e)
             raise
     
+    # Read size for command output
+    READ_CHUNK = 65536
+    
     def execute_command(self, command: str) -> tuple:
-        """Execute SSH command"""
-        if not self.client:
-            self.connect()
-        
-        stdin, stdout, stderr = self.client.exec_command(command)
-        output = stdout.read().decode()
-        error = stderr.read().decode()
+        """Execute SSH command, connecting on first use"""
+        with self._connect_lock:
+            if not self.client:
+                self.connect()
+            # Connected: later calls go straight to the fast path
+            self.execute_command = self._execute_command_fast
+        return self._execute_command_fast(command)
+    
+    def _execute_command_fast(self, command: str) -> tuple:
+        """Execute SSH command on the open connection"""
+        stdin, stdout, stderr = self.client.exec_command(command, bufsize=-1)
+        output = self._read_stream(stdout)
+        error = self._read_stream(stderr)
+        # Output is drained first so a full channel window can't stall the command
+        stdout.channel.recv_exit_status()
         return output, error
     
+    def _read_stream(self, stream) -> str:
+        """Read a channel stream to EOF in fixed-size chunks"""
+        data = bytearray()
+        for chunk in iter(lambda: stream.read(self.READ_CHUNK), b""):
+            data += chunk
+        return data.decode()
+    
+    async def execute_command_async(self, command: str) -> tuple:
+        """Execute SSH command without blocking the event loop"""
+        return await self._run_blocking(self.execute_command, command)
+    
     def install_wordpress(self, path: str, db_config: Dict) -> bool:
         """Install WordPress via WP-CLI"""
         self.logger.info("Installing WordPress...")
@@ -1090,11 +1670,13 @@ class SSHClient:
             f"wp core install --url={db_config['url']} --title='{db_config['title']}' --admin_user={db_config['admin_user']} --admin_password={db_config['admin_pass']} --admin_email={db_config['admin_email']}"
         ]
         
-        for cmd in commands:
-            output, error = self.execute_command(cmd)
-            if error:
-                self.logger.error(f"Command failed: {cmd}\nError: {error}")
-                return False
+        # One channel for the whole sequence: separate exec_command calls each
+        # start a fresh shell, so the cd would not apply to the wp commands
+        command = " && ".join(commands)
+        output, error = self.execute_command(command)
+        if error:
+            self.logger.error("Command failed: %s\nError: %s", command, error)
+            return False
         
         return True
     
@@ -1110,10 +1692,36 @@ class SSHClient:
         output, error = self.execute_command(command)
         return not error
     
+    def install_plugins_via_cli(self, plugin_slugs: List[str]) -> bool:
+        """Install and activate several plugins with a single WP-CLI call"""
+        if not plugin_slugs:
+            return True
+        command = f"wp plugin install {' '.join(plugin_slugs)} --activate"
+        output, error = self.execute_command(command)
+        return not error
+    
+    async def install_wordpress_async(self, path: str, db_config: Dict) -> bool:
+        """Install WordPress without blocking the event loop"""
+        return await self._run_blocking(self.install_wordpress, path, db_config)
+    
+    async def install_theme_via_cli_async(self, theme_slug: str) -> bool:
+        """Install theme without blocking the event loop"""
+        return await self._run_blocking(self.install_theme_via_cli, theme_slug)
+    
+    async def install_plugins_via_cli_async(self, plugin_slugs: List[str]) -> bool:
+        """Install plugins without blocking the event loop"""
+        return await self._run_blocking(self.install_plugins_via_cli, plugin_slugs)
+    
     def close(self):
         """Close SSH connection"""
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         if self.client:
             self.client.close()
+            self.client = None
+            # Drop the fast path so the next command reconnects
+            self.__dict__.pop("execute_command", None)
             self.logger.info("SSH connection closed")
 
 
@@ -1121,6 +1729,90 @@ class SSHClient:
 # AI CLIENT (Mock/Abstract)
 # ============================================================================
 
+_BIZ_NAME_RE = re.compile(r"Business name:\s*(.+)")
+
+# Mock prompt markers in one case-insensitive pattern, one named group each
+_MOCK_DISPATCH_RE = re.compile(
+    r"(?P<plan>site architecture)"
+    r"|(?P<content>generate production-ready wordpress content)"
+    r"|(?P<posts>blog posts)",
+    re.IGNORECASE
+)
+
+
+# Mock responses, serialized once at import
+_BUSINESS_NAME_PLACEHOLDER = "{BUSINESS_NAME}"
+
+_PLANNING_TEMPLATE_JSON = orjson.dumps({
+    "status": "ok",
+    "action": "site_architecture_generated",
+    "result_summary": "Generated architecture for {BUSINESS_NAME}",
+    "result": {
+        "site_structure": {
+            "pages": [
+                {"title": "Home", "slug": "home", "purpose": "Welcome visitors", "content_themes": ["hero", "services"], "priority": "high", "template": "front-page"},
+                {"title": "About Us", "slug": "about", "purpose": "Tell story", "content_themes": ["history", "team"], "priority": "high", "template": "default"},
+                {"title": "Services", "slug": "services", "purpose": "Detail services", "content_themes": ["service_list"], "priority": "high", "template": "default"},
+                {"title": "Menu", "slug": "menu", "purpose": "Display menu", "content_themes": ["menu_items"], "priority": "high", "template": "default"},
+                {"title": "Gallery", "slug": "gallery", "purpose": "Showcase photos", "content_themes": ["photos"], "priority": "medium", "template": "default"},
+                {"title": "Contact", "slug": "contact", "purpose": "Contact info", "content_themes": ["form", "map"], "priority": "high", "template": "default"},
+                {"title": "Blog", "slug": "blog", "purpose": "News updates", "content_themes": ["posts"], "priority": "medium", "template": "default"}
+            ],
+            "menus": [{"location": "primary", "name": "Main Menu", "items": ["Home", "About", "Services", "Contact"]}]
+        },
+        "features": [{"name": "Contact Form", "priority": "high", "implementation": "plugin"}],
+        "plugins": [
+            {"name": "Contact Form 7", "slug": "contact-form-7", "purpose": "Contact forms", "required": True},
+            {"name": "Yoast SEO", "slug": "wordpress-seo", "purpose": "SEO", "required": True}
+        ],
+        "content_strategy": {
+            "post_types": ["posts"],
+            "initial_categories": ["News", "Updates"],
+            "suggested_posts": [
+                {"title": "Welcome", "theme": "introduction"},
+                {"title": "Our Story", "theme": "history"},
+                {"title": "Quality Matters", "theme": "values"}
+            ]
+        },
+        "seo_foundation": {
+            "primary_keywords": ["restaurant", "pizza", "italian"],
+            "site_tagline": "Authentic Italian Cuisine",
+            "meta_description_template": "{BUSINESS_NAME} - Your trusted local business"
+        }
+    },
+    "assumptions": [],
+    "confidence": 0.87,
+    "next_steps": ["generate_content"]
+}).decode()
+
+_GENERIC_RESPONSE_JSON = orjson.dumps({
+    "status": "ok",
+    "action": "generic_action",
+    "result_summary": "Generic result",
+    "result": {},
+    "assumptions": [],
+    "confidence": 0.85,
+    "next_steps": []
+}).decode()
+
+_CONTENT_RESPONSE_JSON = orjson.dumps({
+    "pages": [
+        {"title": "Home", "slug": "home", "content_html": "<h1>Welcome</h1><p>Experience authentic cuisine...</p>", "seo": {"title": "Home", "meta_description": "Welcome to our restaurant", "slug": "home", "focus_keyword": "restaurant"}},
+        {"title": "About Us", "slug": "about", "content_html": "<h1>Our Story</h1><p>Since 1985...</p>", "seo": {"title": "About", "meta_description": "Our story", "slug": "about", "focus_keyword": "about"}},
+        {"title": "Menu", "slug": "menu", "content_html": "<h1>Menu</h1><p>Delicious dishes...</p>", "seo": {"title": "Menu", "meta_description": "Our menu", "slug": "menu", "focus_keyword": "menu"}},
+        {"title": "Contact", "slug": "contact", "content_html": "<h1>Contact</h1><p>Get in touch...</p>", "seo": {"title": "Contact", "meta_description": "Contact us", "slug": "contact", "focus_keyword": "contact"}}
+    ]
+}).decode()
+
+_POSTS_RESPONSE_JSON = orjson.dumps({
+    "posts": [
+        {"title": "Welcome", "slug": "welcome", "content_html": "<p>Welcome post...</p>", "excerpt": "Welcome", "categories": ["News"], "tags": ["welcome"]},
+        {"title": "Our Story", "slug": "our-story", "content_html": "<p>Our journey...</p>", "excerpt": "Our story", "categories": ["News"], "tags": ["history"]},
+        {"title": "Quality", "slug": "quality", "content_html": "<p>Quality matters...</p>", "excerpt": "Quality", "categories": ["Updates"], "tags": ["quality"]}
+    ]
+}).decode()
+
+
 class AIClient:
     """AI model client for generating responses"""
     
@@ -1137,107 +1829,43 @@ class AIClient:
         max_tokens: int = 600
     ) -> str:
         """Generate AI response (implement with actual API)"""
-        self.logger.info(f"Generating AI response (max_tokens={max_tokens})")
+        self.logger.info("Generating AI response (max_tokens=%s)", max_tokens)
         
         # This is an enhanced mock implementation for testing
         # In production, replace with actual AI API (Anthropic, OpenAI, etc.)
         
-        import re
-        
-        # Detect agent type from prompt and return realistic data
-        if "site architecture" in prompt.lower():
+        # Detect agent type from prompt and return realistic data. One scan
+        # finds every marker; the highest-priority one wins.
+        matched = {match.lastgroup for match in _MOCK_DISPATCH_RE.finditer(prompt)}
+        if "plan" in matched:
             return self._generate_planning_response(prompt)
-        elif "generate production-ready wordpress content" in prompt.lower():
+        elif "content" in matched:
             return self._generate_content_response(prompt)
-        elif "blog posts" in prompt.lower():
+        elif "posts" in matched:
             return self._generate_posts_response(prompt)
         else:
             # Default response
-            return json.dumps({
-                "status": "ok",
-                "action": "generic_action",
-                "result_summary": "Generic result",
-                "result": {},
-                "assumptions": [],
-                "confidence": 0.85,
-                "next_steps": []
-            })
+            return _GENERIC_RESPONSE_JSON
     
     def _extract_business_name(self, prompt: str) -> str:
         """Extract business name from prompt"""
-        import re
-        match = re.search(r"Business name:\s*(.+)", prompt)
+        match = _BIZ_NAME_RE.search(prompt)
         return match.group(1).strip() if match else "Business"
     
     def _generate_planning_response(self, prompt: str) -> str:
         """Generate site planning response"""
         business_name = self._extract_business_name(prompt)
-        
-        response = {
-            "status": "ok",
-            "action": "site_architecture_generated",
-            "result_summary": f"Generated architecture for {business_name}",
-            "result": {
-                "site_structure": {
-                    "pages": [
-                        {"title": "Home", "slug": "home", "purpose": "Welcome visitors", "content_themes": ["hero", "services"], "priority": "high", "template": "front-page"},
-                        {"title": "About Us", "slug": "about", "purpose": "Tell story", "content_themes": ["history", "team"], "priority": "high", "template": "default"},
-                        {"title": "Services", "slug": "services", "purpose": "Detail services", "content_themes": ["service_list"], "priority": "high", "template": "default"},
-                        {"title": "Menu", "slug": "menu", "purpose": "Display menu", "content_themes": ["menu_items"], "priority": "high", "template": "default"},
-                        {"title": "Gallery", "slug": "gallery", "purpose": "Showcase photos", "content_themes": ["photos"], "priority": "medium", "template": "default"},
-                        {"title": "Contact", "slug": "contact", "purpose": "Contact info", "content_themes": ["form", "map"], "priority": "high", "template": "default"},
-                        {"title": "Blog", "slug": "blog", "purpose": "News updates", "content_themes": ["posts"], "priority": "medium", "template": "default"}
-                    ],
-                    "menus": [{"location": "primary", "name": "Main Menu", "items": ["Home", "About", "Services", "Contact"]}]
-                },
-                "features": [{"name": "Contact Form", "priority": "high", "implementation": "plugin"}],
-                "plugins": [
-                    {"name": "Contact Form 7", "slug": "contact-form-7", "purpose": "Contact forms", "required": True},
-                    {"name": "Yoast SEO", "slug": "wordpress-seo", "purpose": "SEO", "required": True}
-                ],
-                "content_strategy": {
-                    "post_types": ["posts"],
-                    "initial_categories": ["News", "Updates"],
-                    "suggested_posts": [
-                        {"title": "Welcome", "theme": "introduction"},
-                        {"title": "Our Story", "theme": "history"},
-                        {"title": "Quality Matters", "theme": "values"}
-                    ]
-                },
-                "seo_foundation": {
-                    "primary_keywords": ["restaurant", "pizza", "italian"],
-                    "site_tagline": "Authentic Italian Cuisine",
-                    "meta_description_template": f"{business_name} - Your trusted local business"
-                }
-            },
-            "assumptions": [],
-            "confidence": 0.87,
-            "next_steps": ["generate_content"]
-        }
-        return json.dumps(response)
+        # JSON-escape the name before splicing it into the serialized template
+        escaped_name = orjson.dumps(business_name).decode()[1:-1]
+        return _PLANNING_TEMPLATE_JSON.replace(_BUSINESS_NAME_PLACEHOLDER, escaped_name)
     
     def _generate_content_response(self, prompt: str) -> str:
         """Generate page content response"""
-        response = {
-            "pages": [
-                {"title": "Home", "slug": "home", "content_html": "<h1>Welcome</h1><p>Experience authentic cuisine...</p>", "seo": {"title": "Home", "meta_description": "Welcome to our restaurant", "slug": "home", "focus_keyword": "restaurant"}},
-                {"title": "About Us", "slug": "about", "content_html": "<h1>Our Story</h1><p>Since 1985...</p>", "seo": {"title": "About", "meta_description": "Our story", "slug": "about", "focus_keyword": "about"}},
-                {"title": "Menu", "slug": "menu", "content_html": "<h1>Menu</h1><p>Delicious dishes...</p>", "seo": {"title": "Menu", "meta_description": "Our menu", "slug": "menu", "focus_keyword": "menu"}},
-                {"title": "Contact", "slug": "contact", "content_html": "<h1>Contact</h1><p>Get in touch...</p>", "seo": {"title": "Contact", "meta_description": "Contact us", "slug": "contact", "focus_keyword": "contact"}}
-            ]
-        }
-        return json.dumps(response)
+        return _CONTENT_RESPONSE_JSON
     
     def _generate_posts_response(self, prompt: str) -> str:
         """Generate blog posts response"""
-        response = {
-            "posts": [
-                {"title": "Welcome", "slug": "welcome", "content_html": "<p>Welcome post...</p>", "excerpt": "Welcome", "categories": ["News"], "tags": ["welcome"]},
-                {"title": "Our Story", "slug": "our-story", "content_html": "<p>Our journey...</p>", "excerpt": "Our story", "categories": ["News"], "tags": ["history"]},
-                {"title": "Quality", "slug": "quality", "content_html": "<p>Quality matters...</p>", "excerpt": "Quality", "categories": ["Updates"], "tags": ["quality"]}
-            ]
-        }
-        return json.dumps(response)
+        return _POSTS_RESPONSE_JSON
 
 
 # ============================================================================
@@ -1299,7 +1927,11 @@ class GSWStudioPlatform:
         )
         
         # Generate site
-        result = await orchestrator.generate_site(business_input)
+        try:
+            result = await orchestrator.generate_site(business_input)
+        finally:
+            if wp_api_client:
+                await wp_api_client.close()
         
         return result
 
@@ -1311,6 +1943,11 @@ class GSWStudioPlatform:
 class MockWordPressAPI:
     """Mock WordPress API for testing"""
     
+    def __init__(self):
+        self.active_theme = None
+        self.active_plugins = []
+        self.page_count = 0
+    
     async def __aenter__(self):
         return self
     
@@ -1320,22 +1957,45 @@ class MockWordPressAPI:
     async def test_connection(self):
         return True
     
+    async def check_https(self):
+        return False
+    
+    async def get_active_theme(self):
+        return self.active_theme
+    
+    async def list_active_plugins(self):
+        return list(self.active_plugins)
+    
+    async def count_pages(self):
+        return self.page_count
+    
     async def create_page(self, page_data):
+        self.page_count += 1
         return {"id": 1, "title": page_data.get("title")}
     
     async def create_post(self, post_data):
         return {"id": 1, "title": post_data.get("title")}
     
+    async def create_batch(self, kind, items):
+        create = self.create_page if kind == "pages" else self.create_post
+        results = await asyncio.gather(*(create(item) for item in items), return_exceptions=True)
+        return [None if isinstance(result, Exception) else result for result in results]
+    
     async def install_theme(self, theme_slug):
         return True
     
     async def activate_theme(self, theme_slug):
+        self.active_theme = theme_slug
         return True
     
     async def install_plugin(self, plugin_slug):
         return True
     
+    async def is_plugin_installed(self, plugin_slug):
+        return True
+    
     async def activate_plugin(self, plugin_slug):
+        self.active_plugins.append(plugin_slug)
         return True
     
     async def create_menu(self, menu_data):
@@ -1354,6 +2014,9 @@ class MockSSHClient:
     def execute_command(self, command):
         return ("Success", "")
     
+    async def execute_command_async(self, command):
+        return self.execute_command(command)
+    
     def close(self):
         pass
 
@@ -1386,7 +2049,7 @@ async def main():
     )
     
     # Print results
-    print(json.dumps(result, indent=2))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
     
     # Example output structure:
     """
@@ -1419,5 +2082,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     # Run the platform
     asyncio.run(main())
\ No newline at end of file
@@ -3,276 +3,308 @@ Enhanced Mock AI Client for ZipWP Testing
 Returns realistic data structures for all agent types
 """
 
-import json
+import orjson
 import re
+from functools import lru_cache
 
 
-class EnhancedMockAIClient:
-    """Enhanced mock AI client that returns realistic responses based on prompt type"""
-    
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4"):
-        self.api_key = api_key
-        self.model = model
-    
-    async def generate(
-        self, 
-        prompt: str, 
-        temperature: float = 0.1, 
-        top_p: float = 0.8,
-        max_tokens: int = 600
-    ) -> str:
-        """Generate contextual mock response based on prompt"""
-        
-        # Detect agent type from prompt
-        if "site architecture" in prompt.lower():
-            return self._generate_planning_response(prompt)
-        elif "generate production-ready wordpress content" in prompt.lower():
-            return self._generate_content_response(prompt)
-        elif "blog posts" in prompt.lower():
-            return self._generate_posts_response(prompt)
-        else:
-            # Default response
-            return json.dumps({
-                "status": "ok",
-                "action": "generic_action",
-                "result_summary": "Generic result",
-                "result": {},
-                "assumptions": [],
-                "confidence": 0.85,
-                "next_steps": []
-            })
-    
-    def _extract_business_name(self, prompt: str) -> str:
-        """Extract business name from prompt"""
-        match = re.search(r"Business name:\s*(.+)", prompt)
-        return match.group(1).strip() if match else "Business"
-    
-    def _generate_planning_response(self, prompt: str) -> str:
-        """Generate site planning response"""
-        business_name = self._extract_business_name(prompt)
-        
-        response = {
-            "status": "ok",
-            "action": "site_architecture_generated",
-            "result_summary": f"Generated architecture for {business_name}",
-            "result": {
-                "site_structure": {
-                    "pages": [
-                        {
-                            "title": "Home",
-                            "slug": "home",
-                            "purpose": "Welcome visitors and showcase key offerings",
-                            "content_themes": ["hero_section", "services_overview", "testimonials", "cta"],
-                            "priority": "high",
-                            "template": "front-page"
-                        },
-                        {
-                            "title": "About Us",
-                            "slug": "about",
-                            "purpose": "Tell the business story and build trust",
-                            "content_themes": ["company_history", "team", "values", "mission"],
-                            "priority": "high",
-                            "template": "default"
-                        },
-                        {
-                            "title": "Services",
-                            "slug": "services",
-                            "purpose": "Detail all services offered",
-                            "content_themes": ["service_list", "pricing", "process"],
-                            "priority": "high",
-                            "template": "default"
-                        },
-                        {
-                            "title": "Menu",
-                            "slug": "menu",
-                            "purpose": "Display food menu and pricing",
-                            "content_themes": ["menu_items", "specials", "pricing"],
-                            "priority": "high",
-                            "template": "default"
-                        },
-                        {
-                            "title": "Gallery",
-                            "slug": "gallery",
-                            "purpose": "Showcase photos",
-                            "content_themes": ["photo_gallery"],
-                            "priority": "medium",
-                            "template": "default"
-                        },
-                        {
-                            "title": "Contact",
-                            "slug": "contact",
-                            "purpose": "Provide contact information and form",
-                            "content_themes": ["contact_form", "location_map", "hours"],
-                            "priority": "high",
-                            "template": "default"
-                        },
-                        {
-                            "title": "Blog",
-                            "slug": "blog",
-                            "purpose": "Share news and updates",
-                            "content_themes": ["blog_posts"],
-                            "priority": "medium",
-                            "template": "default"
-                        }
-                    ],
-                    "menus": [
-                        {
-                            "location": "primary",
-                            "name": "Main Menu",
-                            "items": ["Home", "About Us", "Services", "Menu", "Gallery", "Contact", "Blog"]
-                        }
-                    ]
-                },
-                "features": [
-                    {
-                        "name": "Contact Form",
-                        "priority": "high",
-                        "implementation": "plugin"
-                    },
-                    {
-                        "name": "Online Ordering",
-                        "priority": "medium",
-                        "implementation": "plugin"
-                    },
-                    {
-                        "name": "Photo Gallery",
-                        "priority": "medium",
-                        "implementation": "theme"
-                    }
-                ],
-                "plugins": [
-                    {
-                        "name": "Contact Form 7",
-                        "slug": "contact-form-7",
-                        "purpose": "Handle contact inquiries",
-                        "required": True
-                    },
-                    {
-                        "name": "Yoast SEO",
-                        "slug": "wordpress-seo",
-                        "purpose": "Search engine optimization",
-                        "required": True
-                    },
-                    {
-                        "name": "WP Super Cache",
-                        "slug": "wp-super-cache",
-                        "purpose": "Performance optimization",
-                        "required": True
-                    }
-                ],
-                "content_strategy": {
-                    "post_types": ["posts"],
-                    "initial_categories": ["News", "Updates", "Recipes"],
-                    "suggested_posts": [
-                        {
-                            "title": "Welcome to Our Restaurant",
-                            "theme": "introduction"
-                        },
-                        {
-                            "title": "Our Story: Family Tradition Since 1985",
-                            "theme": "history"
-                        },
-                        {
-                            "title": "Fresh Ingredients, Authentic Taste",
-                            "theme": "quality"
-                        }
-                    ]
-                },
-                "seo_foundation": {
-                    "primary_keywords": ["pizza restaurant", "italian food", "brooklyn pizza"],
-                    "site_tagline": "Authentic Italian Pizza Since 1985",
-                    "meta_description_template": f"{business_name} - Your trusted local business"
-                }
-            },
-            "assumptions": [],
-            "confidence": 0.87,
-            "next_steps": ["generate_content"]
-        }
-        
-        return json.dumps(response)
-    
-    def _generate_content_response(self, prompt: str) -> str:
-        """Generate page content response"""
-        response = {
+_BIZ_NAME_RE = re.compile(r"Business name:\s*(.+)")
+
+# Prompt markers -> response builder, in priority order
+_PROMPT_TYPES = {
+    "site architecture": "_generate_planning_response",
+    "generate production-ready wordpress content": "_generate_content_response",
+    "blog posts": "_generate_posts_response",
+}
+
+# All markers in one case-insensitive pattern; group N is the Nth marker
+_PROMPT_TYPE_RE = re.compile(
+    "|".join(f"({re.escape(marker)})" for marker in _PROMPT_TYPES),
+    re.IGNORECASE
+)
+_BUILDERS = tuple(_PROMPT_TYPES.values())
+
+
+# Fixture responses, serialized once at import
+_BUSINESS_NAME_PLACEHOLDER = "{BUSINESS_NAME}"
+
+_PLANNING_TEMPLATE_JSON = orjson.dumps({
+    "status": "ok",
+    "action": "site_architecture_generated",
+    "result_summary": "Generated architecture for {BUSINESS_NAME}",
+    "result": {
+        "site_structure": {
             "pages": [
                 {
                     "title": "Home",
                     "slug": "home",
-                    "content_html": "<h1>Welcome to Our Restaurant</h1><p>Experience authentic Italian cuisine...</p>",
-                    "seo": {
-                        "title": "Home - Authentic Italian Pizza",
-                        "meta_description": "Family-owned pizza restaurant serving authentic Italian pizza since 1985",
-                        "slug": "home",
-                        "focus_keyword": "italian pizza"
-                    }
+                    "purpose": "Welcome visitors and showcase key offerings",
+                    "content_themes": ["hero_section", "services_overview", "testimonials", "cta"],
+                    "priority": "high",
+                    "template": "front-page"
                 },
                 {
                     "title": "About Us",
                     "slug": "about",
-                    "content_html": "<h1>Our Story</h1><p>Since 1985, we've been serving Brooklyn...</p>",
-                    "seo": {
-                        "title": "About Us - Our Story",
-                        "meta_description": "Learn about our family tradition of authentic Italian cooking",
-                        "slug": "about",
-                        "focus_keyword": "family restaurant"
-                    }
+                    "purpose": "Tell the business story and build trust",
+                    "content_themes": ["company_history", "team", "values", "mission"],
+                    "priority": "high",
+                    "template": "default"
+                },
+                {
+                    "title": "Services",
+                    "slug": "services",
+                    "purpose": "Detail all services offered",
+                    "content_themes": ["service_list", "pricing", "process"],
+                    "priority": "high",
+                    "template": "default"
                 },
                 {
                     "title": "Menu",
                     "slug": "menu",
-                    "content_html": "<h1>Our Menu</h1><h2>Pizzas</h2><p>Margherita, Pepperoni, Quattro Formaggi...</p>",
-                    "seo": {
-                        "title": "Menu - Pizza & Italian Dishes",
-                        "meta_description": "View our full menu of authentic Italian pizzas and dishes",
-                        "slug": "menu",
-                        "focus_keyword": "pizza menu"
-                    }
+                    "purpose": "Display food menu and pricing",
+                    "content_themes": ["menu_items", "specials", "pricing"],
+                    "priority": "high",
+                    "template": "default"
+                },
+                {
+                    "title": "Gallery",
+                    "slug": "gallery",
+                    "purpose": "Showcase photos",
+                    "content_themes": ["photo_gallery"],
+                    "priority": "medium",
+                    "template": "default"
                 },
                 {
                     "title": "Contact",
                     "slug": "contact",
-                    "content_html": "<h1>Contact Us</h1><p>Visit us or get in touch...</p>",
-                    "seo": {
-                        "title": "Contact Us - Get In Touch",
-                        "meta_description": "Contact us for reservations or inquiries",
-                        "slug": "contact",
-                        "focus_keyword": "contact"
-                    }
+                    "purpose": "Provide contact information and form",
+                    "content_themes": ["contact_form", "location_map", "hours"],
+                    "priority": "high",
+                    "template": "default"
+                },
+                {
+                    "title": "Blog",
+                    "slug": "blog",
+                    "purpose": "Share news and updates",
+                    "content_themes": ["blog_posts"],
+                    "priority": "medium",
+                    "template": "default"
+                }
+            ],
+            "menus": [
+                {
+                    "location": "primary",
+                    "name": "Main Menu",
+                    "items": ["Home", "About Us", "Services", "Menu", "Gallery", "Contact", "Blog"]
                 }
             ]
-        }
-        
-        return json.dumps(response)
-    
-    def _generate_posts_response(self, prompt: str) -> str:
-        """Generate blog posts response"""
-        response = {
-            "posts": [
+        },
+        "features": [
+            {
+                "name": "Contact Form",
+                "priority": "high",
+                "implementation": "plugin"
+            },
+            {
+                "name": "Online Ordering",
+                "priority": "medium",
+                "implementation": "plugin"
+            },
+            {
+                "name": "Photo Gallery",
+                "priority": "medium",
+                "implementation": "theme"
+            }
+        ],
+        "plugins": [
+            {
+                "name": "Contact Form 7",
+                "slug": "contact-form-7",
+                "purpose": "Handle contact inquiries",
+                "required": True
+            },
+            {
+                "name": "Yoast SEO",
+                "slug": "wordpress-seo",
+                "purpose": "Search engine optimization",
+                "required": True
+            },
+            {
+                "name": "WP Super Cache",
+                "slug": "wp-super-cache",
+                "purpose": "Performance optimization",
+                "required": True
+            }
+        ],
+        "content_strategy": {
+            "post_types": ["posts"],
+            "initial_categories": ["News", "Updates", "Recipes"],
+            "suggested_posts": [
                 {
                     "title": "Welcome to Our Restaurant",
-                    "slug": "welcome",
-                    "content_html": "<p>We're excited to welcome you to our family restaurant...</p>",
-                    "excerpt": "Welcome to our authentic Italian restaurant",
-                    "categories": ["News"],
-                    "tags": ["welcome", "announcement"]
+                    "theme": "introduction"
                 },
                 {
                     "title": "Our Story: Family Tradition Since 1985",
-                    "slug": "our-story",
-                    "content_html": "<p>Our journey began in 1985 when...</p>",
-                    "excerpt": "Learn about our family's journey",
-                    "categories": ["News"],
-                    "tags": ["history", "family"]
+                    "theme": "history"
                 },
                 {
                     "title": "Fresh Ingredients, Authentic Taste",
-                    "slug": "fresh-ingredients",
-                    "content_html": "<p>We source only the finest ingredients...</p>",
-                    "excerpt": "Quality ingredients make the difference",
-                    "categories": ["Updates"],
-                    "tags": ["quality", "ingredients"]
+                    "theme": "quality"
                 }
             ]
+        },
+        "seo_foundation": {
+            "primary_keywords": ["pizza restaurant", "italian food", "brooklyn pizza"],
+            "site_tagline": "Authentic Italian Pizza Since 1985",
+            "meta_description_template": "{BUSINESS_NAME} - Your trusted local business"
+        }
+    },
+    "assumptions": [],
+    "confidence": 0.87,
+    "next_steps": ["generate_content"]
+}).decode()
+
+_GENERIC_RESPONSE_JSON = orjson.dumps({
+    "status": "ok",
+    "action": "generic_action",
+    "result_summary": "Generic result",
+    "result": {},
+    "assumptions": [],
+    "confidence": 0.85,
+    "next_steps": []
+}).decode()
+
+_CONTENT_RESPONSE_JSON = orjson.dumps({
+    "pages": [
+        {
+            "title": "Home",
+            "slug": "home",
+            "content_html": "<h1>Welcome to Our Restaurant</h1><p>Experience authentic Italian cuisine...</p>",
+            "seo": {
+                "title": "Home - Authentic Italian Pizza",
+                "meta_description": "Family-owned pizza restaurant serving authentic Italian pizza since 1985",
+                "slug": "home",
+                "focus_keyword": "italian pizza"
+            }
+        },
+        {
+            "title": "About Us",
+            "slug": "about",
+            "content_html": "<h1>Our Story</h1><p>Since 1985, we've been serving Brooklyn...</p>",
+            "seo": {
+                "title": "About Us - Our Story",
+                "meta_description": "Learn about our family tradition of authentic Italian cooking",
+                "slug": "about",
+                "focus_keyword": "family restaurant"
+            }
+        },
+        {
+            "title": "Menu",
+            "slug": "menu",
+            "content_html": "<h1>Our Menu</h1><h2>Pizzas</h2><p>Margherita, Pepperoni, Quattro Formaggi...</p>",
+            "seo": {
+                "title": "Menu - Pizza & Italian Dishes",
+                "meta_description": "View our full menu of authentic Italian pizzas and dishes",
+                "slug": "menu",
+                "focus_keyword": "pizza menu"
+            }
+        },
+        {
+            "title": "Contact",
+            "slug": "contact",
+            "content_html": "<h1>Contact Us</h1><p>Visit us or get in touch...</p>",
+            "seo": {
+                "title": "Contact Us - Get In Touch",
+                "meta_description": "Contact us for reservations or inquiries",
+                "slug": "contact",
+                "focus_keyword": "contact"
+            }
         }
+    ]
+}).decode()
+
+_POSTS_RESPONSE_JSON = orjson.dumps({
+    "posts": [
+        {
+            "title": "Welcome to Our Restaurant",
+            "slug": "welcome",
+            "content_html": "<p>We're excited to welcome you to our family restaurant...</p>",
+            "excerpt": "Welcome to our authentic Italian restaurant",
+            "categories": ["News"],
+            "tags": ["welcome", "announcement"]
+        },
+        {
+            "title": "Our Story: Family Tradition Since 1985",
+            "slug": "our-story",
+            "content_html": "<p>Our journey began in 1985 when...</p>",
+            "excerpt": "Learn about our family's journey",
+            "categories": ["News"],
+            "tags": ["history", "family"]
+        },
+        {
+            "title": "Fresh Ingredients, Authentic Taste",
+            "slug": "fresh-ingredients",
+            "content_html": "<p>We source only the finest ingredients...</p>",
+            "excerpt": "Quality ingredients make the difference",
+            "categories": ["Updates"],
+            "tags": ["quality", "ingredients"]
+        }
+    ]
+}).decode()
+
+
+class EnhancedMockAIClient:
+    """Enhanced mock AI client that returns realistic responses based on prompt type"""
+    
+    def __init__(self, api_key: str, model: str = "claude-sonnet-4"):
+        self.api_key = api_key
+        self.model = model
+        # Responses are a pure function of (prompt type, business name).
+        # Bounded, since business names are free text.
+        self._respond = lru_cache(maxsize=128)(self._build_response)
+    
+    async def generate(
+        self, 
+        prompt: str, 
+        temperature: float = 0.1, 
+        top_p: float = 0.8,
+        max_tokens: int = 600
+    ) -> str:
+        """Generate contextual mock response based on prompt"""
+        
+        # Detect agent type from prompt. A single scan finds every marker,
+        # without lowercasing the prompt; the highest-priority one wins.
+        matched = {match.lastindex for match in _PROMPT_TYPE_RE.finditer(prompt)}
         
-        return json.dumps(response)
+        if matched:
+            # The name is extracted once, for both the cache key and the builder
+            builder = _BUILDERS[min(matched) - 1]
+            return self._respond(builder, self._extract_business_name(prompt))
+        else:
+            # Default response
+            return _GENERIC_RESPONSE_JSON
+    
+    def _build_response(self, builder: str, business_name: str) -> str:
+        """Build the response for one prompt type and business name"""
+        return getattr(self, builder)(business_name)
+    
+    def _extract_business_name(self, prompt: str) -> str:
+        """Extract business name from prompt"""
+        match = _BIZ_NAME_RE.search(prompt)
+        return match.group(1).strip() if match else "Business"
+    
+    def _generate_planning_response(self, business_name: str) -> str:
+        """Generate site planning response"""
+        # JSON-escape the name before splicing it into the serialized template
+        escaped_name = orjson.dumps(business_name).decode()[1:-1]
+        return _PLANNING_TEMPLATE_JSON.replace(_BUSINESS_NAME_PLACEHOLDER, escaped_name)
+    
+    def _generate_content_response(self, business_name: str) -> str:
+        """Generate page content response"""
+        return _CONTENT_RESPONSE_JSON
+    
+    def _generate_posts_response(self, business_name: str) -> str:
+        """Generate blog posts response"""
+        return _POSTS_RESPONSE_JSON